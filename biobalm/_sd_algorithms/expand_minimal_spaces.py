@@ -5,8 +5,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from biobalm.succession_diagram import SuccessionDiagram
 
-from biobalm.space_utils import is_subspace
-from biobalm.trappist_core import trappist
+from biobalm.space_utils import space_unique_key
+from biobalm.types import BooleanSpace
 
 
 def expand_minimal_spaces(sd: SuccessionDiagram, size_limit: int | None = None) -> bool:
@@ -14,7 +14,14 @@ def expand_minimal_spaces(sd: SuccessionDiagram, size_limit: int | None = None)
     See `SuccessionDiagram.expand_minimal_spaces` for documentation.
     """
 
-    minimal_traps = trappist(sd.petri_net, problem="min")
+    indices: dict[str, int] = sd._variable_indices  # type: ignore
+
+    # Minimal traps are stored as `(fixed, values)` bitmasks, such that the
+    # containment tests are just a few integer operations instead of
+    # dictionary comparisons.
+    minimal_traps: dict[int, tuple[int, int]] = {}
+    for trap in sd._network_minimal_traps():  # type: ignore
+        minimal_traps[space_unique_key(trap, indices)] = _space_masks(trap, indices)
 
     root = sd.root()
 
@@ -35,6 +42,12 @@ def expand_minimal_spaces(sd: SuccessionDiagram, size_limit: int | None = None)
             # (reversed because we explore the list from the back)
 
         node_space = sd.node_data(node)["space"]
+        (node_fixed, node_values) = _space_masks(node_space, indices)
+        covers_traps = any(
+            (trap_fixed & node_fixed) == node_fixed
+            and ((trap_values ^ node_values) & node_fixed) == 0
+            for (trap_fixed, trap_values) in minimal_traps.values()
+        )
 
         # Remove all immediate successors that are already visited or those who
         # do not cover any new minimal trap space.
@@ -42,7 +55,7 @@ def expand_minimal_spaces(sd: SuccessionDiagram, size_limit: int | None = None)
             if successors[-1] in seen:
                 successors.pop()
                 continue
-            if len([s for s in minimal_traps if is_subspace(s, node_space)]) == 0:
+            if not covers_traps:
                 successors.pop()
                 continue
             break
@@ -52,7 +65,7 @@ def expand_minimal_spaces(sd: SuccessionDiagram, size_limit: int | None = None)
         # of this node is already in the succession diagram.
         if len(successors) == 0:
             if sd.node_is_minimal(node):
-                minimal_traps.remove(sd.node_data(node)["space"])
+                del minimal_traps[space_unique_key(node_space, indices)]
             continue
 
         # At this point, we know that `s` is not visited and it contains
@@ -68,3 +81,18 @@ def expand_minimal_spaces(sd: SuccessionDiagram, size_limit: int | None = None)
 
     assert len(minimal_traps) == 0
     return True
+
+
+def _space_masks(space: BooleanSpace, indices: dict[str, int]) -> tuple[int, int]:
+    """
+    Encode a space as a pair of bitmasks: The first has a bit set for every
+    fixed variable, the second for every variable fixed to `1`.
+    """
+    fixed = 0
+    values = 0
+    for var, val in space.items():
+        bit = 1 << indices[var]
+        fixed |= bit
+        if val == 1:
+            values |= bit
+    return (fixed, values)
@@ -10,6 +10,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Literal, cast
 
 if TYPE_CHECKING:
+    from typing import Callable
+
     from biobalm.succession_diagram import SuccessionDiagram
     from biobalm.types import BooleanSpace
     from networkx import DiGraph  # type: ignore
@@ -17,7 +19,7 @@ if TYPE_CHECKING:
 import random
 import biobalm
 from biodivine_aeon import Bdd, AsynchronousGraph, BddVariable
-from biobalm.trappist_core import compute_fixed_point_reduced_STG
+from biobalm.trappist_core import fixed_point_reduced_STG_solver
 from biobalm.symbolic_utils import state_list_to_bdd, valuation_to_state, state_to_bdd
 
 try:
@@ -189,12 +191,15 @@ def compute_attractor_candidates(
             )
         return [retained_set | node_space]
 
+    # The same Petri net and avoided motifs are used for every retained set,
+    # so the ASP program is only grounded once.
+    fixed_points = fixed_point_reduced_STG_solver(
+        pn_reduced, avoid_subspaces=child_motifs_reduced
+    )
+
     if not greedy_asp_minification:
-        candidate_states = compute_fixed_point_reduced_STG(
-            pn_reduced,
-            retained_set,
-            avoid_subspaces=child_motifs_reduced,
-            solution_limit=sd.config["attractor_candidates_limit"],
+        candidate_states = fixed_points(
+            retained_set, sd.config["attractor_candidates_limit"]
         )
         if len(candidate_states) == sd.config["attractor_candidates_limit"]:
             raise RuntimeError(
@@ -205,11 +210,8 @@ def compute_attractor_candidates(
                 f"[{node_id}] Computed {len(candidate_states)} candidate states without retained set optimization."
             )
     else:
-        candidate_states = compute_fixed_point_reduced_STG(
-            pn_reduced,
-            retained_set,
-            avoid_subspaces=child_motifs_reduced,
-            solution_limit=sd.config["retained_set_optimization_threshold"],
+        candidate_states = fixed_points(
+            retained_set, sd.config["retained_set_optimization_threshold"]
         )
 
         if len(candidate_states) < sd.config["retained_set_optimization_threshold"]:
@@ -227,6 +229,7 @@ def compute_attractor_candidates(
                     sd,
                     node_id,
                     petri_net=pn_reduced,
+                    fixed_points=fixed_points,
                     retained_set=retained_set,
                     candidate_states=candidate_states,
                     avoid_dnf=child_motifs_reduced,
@@ -244,11 +247,8 @@ def compute_attractor_candidates(
             candidate_states = []
             for var in node_nfvs:
                 retained_set[var] = 0
-                candidate_states_zero = compute_fixed_point_reduced_STG(
-                    pn_reduced,
-                    retained_set,
-                    avoid_subspaces=child_motifs_reduced,
-                    solution_limit=sd.config["attractor_candidates_limit"],
+                candidate_states_zero = fixed_points(
+                    retained_set, sd.config["attractor_candidates_limit"]
                 )
 
                 if len(candidate_states_zero) <= len(candidate_states):
@@ -260,11 +260,8 @@ def compute_attractor_candidates(
                     continue
 
                 retained_set[var] = 1
-                candidate_states_one = compute_fixed_point_reduced_STG(
-                    pn_reduced,
-                    retained_set,
-                    avoid_subspaces=child_motifs_reduced,
-                    solution_limit=len(candidate_states_zero),
+                candidate_states_one = fixed_points(
+                    retained_set, len(candidate_states_zero)
                 )
 
                 if (
@@ -312,6 +309,7 @@ def compute_attractor_candidates(
                         sd,
                         node_id,
                         petri_net=pn_reduced,
+                        fixed_points=fixed_points,
                         retained_set=retained_set,
                         candidate_states=candidate_states,
                         avoid_dnf=child_motifs_reduced,
@@ -485,6 +483,9 @@ def run_simulation_minification(
     # is randomized but deterministic.
     generator = random.Random(simulation_seed)
 
+    # Progress reporting is checked in every iteration, so resolve the flag once.
+    debug = sd.config["debug"]
+
     # Retrieve the symbolic variables that encode each network variable and
     # associate them with the corresponding network's update functions.
     symbolic_ctx = graph.symbolic_context()
@@ -507,7 +508,7 @@ def run_simulation_minification(
         filtered_candidates: list[BooleanSpace] = []
 
         for i, state in enumerate(candidate_states):
-            if i % 100 == 99 and sd.config["debug"]:
+            if debug and i % 100 == 99:
                 print(
                     f"[{node_id}] > Simulation progress: {i + 1}/{len(candidate_states)}"
                 )
@@ -573,16 +574,13 @@ def run_simulation_minification(
         candidates_bdd = state_list_to_bdd(symbolic_ctx, candidate_states)
         printed: set[int] = set()
         for i in range(max_iterations):
-            progress = int((i * len(candidate_states)) / max_iterations)
-            if (
-                progress % 100 == 99
-                and sd.config["debug"]
-                and (progress not in printed)
-            ):
-                printed.add(progress)
-                print(
-                    f"[{node_id}] > Simulation progress: {progress + 1}/{len(candidate_states)}"
-                )
+            if debug:
+                progress = int((i * len(candidate_states)) / max_iterations)
+                if progress % 100 == 99 and progress not in printed:
+                    printed.add(progress)
+                    print(
+                        f"[{node_id}] > Simulation progress: {progress + 1}/{len(candidate_states)}"
+                    )
 
             generator.shuffle(symbolic_vars)
             new_candidates_bdd = symbolic_ctx.mk_constant(False)
@@ -624,6 +622,9 @@ def asp_greedy_retained_set_optimization(
     retained_set: BooleanSpace,
     candidate_states: list[BooleanSpace],
     avoid_dnf: list[BooleanSpace],
+    fixed_points: (
+        Callable[[BooleanSpace, int | None], list[BooleanSpace]] | None
+    ) = None,
 ) -> tuple[BooleanSpace, list[BooleanSpace]]:
     """
     Takes a Boolean network encoded as a Petri net and a candidate retained set.
@@ -646,6 +647,10 @@ def asp_greedy_retained_set_optimization(
     avoid_dnf: list[BooleanSpace]
         The list of subspaces in the given network in which candidate
         states can be ignored.
+    fixed_points: Callable[[BooleanSpace, int | None], list[BooleanSpace]] | None
+        A solver for the given `petri_net` and `avoid_dnf` created by
+        :func:`fixed_point_reduced_STG_solver<biobalm.trappist_core.fixed_point_reduced_STG_solver>`.
+        If not given, a new one is created.
 
     Returns
     -------
@@ -653,6 +658,11 @@ def asp_greedy_retained_set_optimization(
         The optimized reatined set, together with the list of candidates that
         are valid for this retained set.
     """
+    if fixed_points is None:
+        fixed_points = fixed_point_reduced_STG_solver(
+            petri_net, avoid_subspaces=avoid_dnf
+        )
+
     done = False
     while not done:
         done = True
@@ -669,13 +679,8 @@ def asp_greedy_retained_set_optimization(
             # candidate set is smaller.
             retained_set_2 = retained_set.copy()
             retained_set_2[var] = cast(Literal[0, 1], 1 - retained_set_2[var])
-            candidate_states_2 = compute_fixed_point_reduced_STG(
-                petri_net,
-                retained_set_2,
-                avoid_subspaces=avoid_dnf,
-                # We don't need all solutions if the result isn't smaller.
-                solution_limit=len(candidate_states),
-            )
+            # We don't need all solutions if the result isn't smaller.
+            candidate_states_2 = fixed_points(retained_set_2, len(candidate_states))
             if len(candidate_states_2) < len(candidate_states):
                 retained_set = retained_set_2
                 candidate_states = candidate_states_2
@@ -735,17 +740,21 @@ def make_heuristic_retained_set(
     # with the values from the one that has the least amount of fixed variables
     # shared with the NFVS.
     if len(avoid_dnf) > 0:
+        # The NFVS is only used for membership tests here, so hash it once
+        # instead of rebuilding a set (or scanning the list) for every space.
+        nfvs_set = set(nfvs)
+
         # Find the child space that has the fewest nodes in common with the NFVS:
         least_common_child_space = avoid_dnf[0]
-        least_common_nodes = len(set(least_common_child_space) & set(nfvs))
+        least_common_nodes = len(nfvs_set.intersection(least_common_child_space))
         for child_space in avoid_dnf:
-            common_nodes = len(set(child_space) & set(nfvs))
+            common_nodes = len(nfvs_set.intersection(child_space))
             if common_nodes < least_common_nodes:
                 least_common_nodes = common_nodes
                 least_common_child_space = child_space
 
         for x in least_common_child_space:
-            if (x not in retained_set) and (x in nfvs):
+            if (x not in retained_set) and (x in nfvs_set):
                 retained_set[x] = least_common_child_space[x]
 
     # Then, set the remaining NFVS variables based on the majority output value
@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from biodivine_aeon import AsynchronousGraph, BooleanNetwork
 
-from biobalm.space_utils import percolate_space_strict
+from biobalm.space_utils import percolate_spaces_strict
 from biobalm.types import BooleanSpace
 
 
@@ -57,17 +57,19 @@ def find_single_node_LDOIs(
     if isinstance(network, BooleanNetwork):
         network = AsynchronousGraph(network)
 
-    LDOIs: dict[tuple[str, int], BooleanSpace] = {}
+    keys: list[tuple[str, int]] = []
+    spaces: list[BooleanSpace] = []
     for var in network.network_variable_names():
         fn_bdd = network.mk_update_function(var)
         if fn_bdd.is_true() or fn_bdd.is_false():
             # Skip constant nodes.
             continue
 
-        LDOIs[(var, 0)] = percolate_space_strict(network, {var: 0})
-        LDOIs[(var, 1)] = percolate_space_strict(network, {var: 1})
+        keys += [(var, 0), (var, 1)]
+        spaces += [{var: 0}, {var: 1}]
 
-    return LDOIs
+    # All spaces are percolated at once, so the network is only prepared once.
+    return dict(zip(keys, percolate_spaces_strict(network, spaces)))
 
 
 def find_single_drivers(
@@ -27,6 +27,7 @@ if TYPE_CHECKING:
 
 import copy
 import re
+from functools import lru_cache
 from typing import cast
 
 from biodivine_aeon import (
@@ -114,10 +115,14 @@ def variable_to_place(variable: str, positive: bool) -> str:
         return f"b0_{variable}"
 
 
+@lru_cache(maxsize=65536)
 def place_to_variable(place: str) -> tuple[str, bool]:
     """
     Extract the variable name and state from a Petri net place name.
 
+    The results are cached, since the same places are decoded repeatedly
+    for every solution of a Petri net query.
+
     Parameters
     ----------
     place : str
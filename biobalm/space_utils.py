@@ -13,6 +13,8 @@ from typing import TYPE_CHECKING, Literal, cast
 
 from biodivine_aeon import (
     AsynchronousGraph,
+    Bdd,
+    BddVariable,
     BddVariableSet,
     BooleanNetwork,
     Percolation,
@@ -23,6 +25,8 @@ from biodivine_aeon import (
 from biobalm.symbolic_utils import function_eval
 
 if TYPE_CHECKING:
+    from typing import Callable, Iterator
+
     from biodivine_aeon import BooleanExpression
 
     from biobalm.types import BooleanSpace
@@ -111,12 +115,14 @@ def dnf_function_is_true(dnf: list[BooleanSpace], state: BooleanSpace) -> bool:
 
 
 def remove_state_from_dnf(
-    dnf: list[BooleanSpace], state: BooleanSpace
+    dnf: list[BooleanSpace], state: BooleanSpace, *, inplace: bool = False
 ) -> list[BooleanSpace]:
     """
     Removes all clauses (conjunctions) that are `True` in the given `state` from a DNF function.
 
-    The result is a new list (i.e., it does not modify the original list).
+    By default, the result is a new list (i.e., it does not modify the original
+    list). With `inplace=True`, the clauses are instead removed from `dnf`
+    directly and `dnf` itself is returned.
 
     Parameters
     ----------
@@ -124,12 +130,24 @@ def remove_state_from_dnf(
         The DNF function to modify.
     state : BooleanSpace
         The state to remove from the function.
+    inplace : bool
+        If `True`, modify `dnf` instead of creating a new list.
+        Default: `False`.
 
     Returns
     -------
     list[BooleanSpace]
         The modified DNF function.
     """
+    if inplace:
+        w = 0
+        for conjunction in dnf:
+            if not conjunction.items() <= state.items():
+                dnf[w] = conjunction
+                w += 1
+        del dnf[w:]
+        return dnf
+
     modified_dnf: list[BooleanSpace] = []
     for conjunction in dnf:
         if conjunction.items() <= state.items():
@@ -153,6 +171,9 @@ def percolate_space_strict(
     `space`. Also, the result only contains any *new* constants, not those that
     are already fixed in `space`.
 
+    To percolate many spaces within the same `network`, use
+    :func:`percolate_spaces_strict`, which prepares the update functions once.
+
     Parameters
     ----------
     network : AsynchronousGraph
@@ -169,33 +190,46 @@ def percolate_space_strict(
         The percolated space.
     """
 
-    result: BooleanSpace = {}
-    restriction: BooleanSpace = copy(space)
-    candidates = set(network.network_variable_names())
+    return _percolate_space_strict_bdd(_strict_update_functions(network), space)
 
-    # Ignore variables that are already fixed.
-    for var in network.network_variable_names():
-        fn_bdd = network.mk_update_function(var)
-        if fn_bdd.is_true() or fn_bdd.is_false():
-            candidates.remove(var)
 
-    done = False
-    while not done:
-        done = True
-        for var in copy(candidates):
-            fn_bdd = network.mk_update_function(var)
-            fn_value = function_eval(fn_bdd, restriction)
-            if fn_value is not None:
-                if var in restriction and restriction[var] != fn_value:
-                    # There is a conflict. We don't want to output this,
-                    # but we also don't want to change the value.
-                    candidates.remove(var)
-                else:
-                    done = False
-                    restriction[var] = fn_value
-                    result[var] = fn_value
-                    candidates.remove(var)
+def percolate_spaces_strict(
+    network: AsynchronousGraph, spaces: list[BooleanSpace]
+) -> list[BooleanSpace]:
+    """
+    Same as :func:`percolate_space_strict`, but percolates every space from
+    `spaces` within the same `network`.
+
+    The update functions of the `network` are only prepared once for all
+    spaces. Furthermore, the update functions of small networks (without
+    parameters) are translated into integer bitmasks, which makes the
+    percolation of each space considerably faster.
+
+    Parameters
+    ----------
+    network : AsynchronousGraph
+        A symbolic representation of the Boolean network (from which state
+        transitions can be generated) in which the percolation is performed.
+    spaces : list[BooleanSpace]
+        The spaces to percolate.
 
+    Returns
+    -------
+    list[BooleanSpace]
+        The percolated spaces, in the same order as `spaces`.
+    """
+
+    small_network = _compile_small_network(network)
+    update_functions: _StrictUpdateFunctions | None = None
+
+    result: list[BooleanSpace] = []
+    for space in spaces:
+        if small_network is not None and all(var in small_network[1] for var in space):
+            result.append(_percolate_space_strict_small(small_network, space))
+            continue
+        if update_functions is None:
+            update_functions = _strict_update_functions(network)
+        result.append(_percolate_space_strict_bdd(update_functions, space))
     return result
 
 
@@ -234,10 +268,12 @@ def percolate_space(
     """
 
     percolated = Percolation.percolate_subspace(network, space)
-    result: BooleanSpace = {}
-    for var, value in percolated.items():
-        var_name = network.get_network_variable_name(var)
-        result[var_name] = cast(Literal[0, 1], int(value))
+    # `VariableId` objects can be used to index the list of names directly.
+    names = network.network_variable_names()
+    result: BooleanSpace = {
+        names[var]: cast(Literal[0, 1], int(value)) for var, value in percolated.items()
+    }
+
     return result
 
 
@@ -279,10 +315,20 @@ def percolation_conflicts(
     else:
         perc_space = percolate_space(network, space)
 
+    # Resolve the BDD variables of the percolated space only once and then
+    # restrict every update function using the same mapping.
+    var_set = network.symbolic_context().bdd_variable_set()
+    bdd_space: dict[BddVariable, bool] = {}
+    for name, value in perc_space.items():
+        bdd_var = var_set.find_variable(name)
+        assert bdd_var is not None
+        bdd_space[bdd_var] = bool(value)
+
     for var, value in perc_space.items():
-        fn_bdd = network.mk_update_function(var)
-        fn_value = function_eval(fn_bdd, perc_space)
-        if fn_value is not None and value != fn_value:
+        restricted = network.mk_update_function(var).r_restrict(bdd_space)
+        if (value == 0 and restricted.is_true()) or (
+            value == 1 and restricted.is_false()
+        ):
             conflicts.add(var)
 
     return conflicts
@@ -337,10 +383,22 @@ def percolate_network(
     # Percolate the space first to ensure everything that can be fixed is fixed.
     space = percolate_space(symbolic_network, space)
 
+    # Resolve the BDD variables of the space only once. The same restriction
+    # is then applied to every update function in the shared `var_set`, which
+    # also lets the BDD operations reuse a single variable set.
+    bdd_space: dict[BddVariable, bool] = {}
+    for name, value in space.items():
+        bdd_var = var_set.find_variable(name)
+        assert bdd_var is not None
+        bdd_space[bdd_var] = bool(value)
+
     # Make a copy of the BN and copy the relevant functions.
     new_bn = copy(bn)
 
-    for var in bn.variables():
+    # With an empty space, no update function can change. Otherwise, only
+    # the functions that depend on the space need to be replaced.
+    variables = bn.variables() if len(space) > 0 else []
+    for var in variables:
         update = bn.get_update_function(var)
         if update is None:
             # This variable is a free input.
@@ -351,10 +409,14 @@ def percolate_network(
                     var, UpdateFunction.mk_const(new_bn, space[name])
                 )
         else:
-            percolated = restrict_expression(
-                update.as_expression(), space, symbolic_context=var_set
-            )
-            new_update = UpdateFunction(new_bn, percolated)
+            percolated = update.as_expression()
+            if percolated.support_set().isdisjoint(space.keys()):
+                # The copied function is already correct.
+                continue
+            # Same as `restrict_expression`, but without re-filtering
+            # the space for every function.
+            bdd = var_set.eval_expression(percolated).r_restrict(bdd_space)
+            new_update = UpdateFunction(new_bn, bdd.to_expression())
             new_bn.set_update_function(var, new_update)
 
     new_bn = new_bn.infer_valid_graph()
@@ -403,7 +465,10 @@ def restrict_expression(
     """
 
     variables = expression.support_set()
-    space = {k: v for k, v in space.items() if k in variables}
+    common = space.keys() & variables
+    if len(common) != len(space):
+        # Only copy the space if it actually contains irrelevant variables.
+        space = {k: space[k] for k in common}
 
     if len(space) == 0:
         return expression
@@ -418,6 +483,49 @@ def restrict_expression(
     return bdd.to_expression()
 
 
+def iter_expression_spaces(
+    expression: BooleanExpression,
+    symbolic_context: BddVariableSet | SymbolicContext | None = None,
+) -> Iterator[BooleanSpace]:
+    """
+    Iterate over subspaces for which the given Boolean expression is true.
+
+    This is a lazy version of :func:`expression_to_space_list`: the subspaces
+    are produced one by one while the underlying BDD clauses are enumerated.
+    Use this method if you only need to iterate over (or count) the subspaces
+    and do not need them stored in a list.
+
+    Parameters
+    ----------
+    expression : BooleanExpression
+        The expression to convert.
+    symbolic_context : BddVariableSet | SymbolicContext | None
+        An optional symbolic context to use to perform the conversion. If not given,
+        a temporary one will be created. See :func:`expression_to_space_list`.
+
+    Returns
+    -------
+    Iterator[BooleanSpace]
+        An iterator over subspaces on which the expression is true.
+    """
+
+    if symbolic_context is None:
+        variables = sorted(expression.support_set())
+        symbolic_context = BddVariableSet(variables)
+    if isinstance(symbolic_context, SymbolicContext):
+        symbolic_context = symbolic_context.bdd_variable_set()
+
+    bdd = symbolic_context.eval_expression(expression)
+
+    for clause in bdd.clause_iterator():
+        space: BooleanSpace = {}
+        for var, value in clause.items():
+            space[symbolic_context.get_variable_name(var)] = cast(
+                Literal[0, 1], int(value)
+            )
+        yield space
+
+
 def expression_to_space_list(
     expression: BooleanExpression,
     symbolic_context: BddVariableSet | SymbolicContext | None = None,
@@ -455,27 +563,12 @@ def expression_to_space_list(
         The list of subspaces on which the expression is true.
     """
 
-    if symbolic_context is None:
-        variables = sorted(expression.support_set())
-        symbolic_context = BddVariableSet(variables)
-    if isinstance(symbolic_context, SymbolicContext):
-        symbolic_context = symbolic_context.bdd_variable_set()
-
-    bdd = symbolic_context.eval_expression(expression)
-
-    sub_spaces: list[BooleanSpace] = []
-    for clause in bdd.clause_iterator():
-        space: BooleanSpace = {}
-        for var, value in clause.items():
-            space[symbolic_context.get_variable_name(var)] = cast(
-                Literal[0, 1], int(value)
-            )
-        sub_spaces.append(space)
-
-    return sub_spaces
+    return list(iter_expression_spaces(expression, symbolic_context))
 
 
-def space_unique_key(space: BooleanSpace, network: BooleanNetwork) -> int:
+def space_unique_key(
+    space: BooleanSpace, network: BooleanNetwork | dict[str, int]
+) -> int:
     """
     Provide a unique hash key for the provided space in a given network.
 
@@ -494,8 +587,10 @@ def space_unique_key(space: BooleanSpace, network: BooleanNetwork) -> int:
     ----------
     space : BooleanSpace
         The space to encode.
-    network : BooleanNetwork
-        The network in which the space is defined.
+    network : BooleanNetwork | dict[str, int]
+        The network in which the space is defined. Alternatively, a mapping
+        from variable names to variable indices of the network, which avoids
+        querying the network for every variable of the space.
 
     Returns
     -------
@@ -506,13 +601,204 @@ def space_unique_key(space: BooleanSpace, network: BooleanNetwork) -> int:
     # Key is a binary encoding of the space dictionary. Since Python has
     # arbitrary-precision integers, this should work for any network and be
     # reasonably fast (we are not doing any copies or string manipulation).
+    # Choose the index lookup once, not for every variable.
+    find_index: Callable[[str], int | None]
+    if isinstance(network, dict):
+        find_index = network.get
+    else:
+        bn = network
+
+        def find_network_index(name: str) -> int | None:
+            var = bn.find_variable(name)
+            return None if var is None else int(var)
+
+        find_index = find_network_index
+
     key: int = 0
     for k, v in space.items():
-        var = network.find_variable(k)
-        if var is None:
-            raise IndexError(f"Unknown variable {var}.")
+        index = find_index(k)
+        if index is None:
+            raise IndexError(f"Unknown variable {k}.")
         # Each variable is encoded as two bits, so the total length
         # of the key is 2 * n and the offset of each variable is 2 * index.
         # 00 - unknown; 10 - zero; 11 - one
-        key |= (v + 2) << (2 * int(var))
+        key |= (v + 2) << (2 * index)
     return key
+
+
+# The BDD of every update function that is not constant, and the names
+# of the variables in its support.
+_StrictUpdateFunctions = tuple[dict[str, Bdd], dict[str, list[str]]]
+
+
+def _strict_update_functions(network: AsynchronousGraph) -> _StrictUpdateFunctions:
+    """
+    Prepare the update functions of the `network` for strict percolation.
+
+    Variables with constant update functions are ignored, since strict
+    percolation does not propagate them.
+    """
+    bdd_variables = network.symbolic_context().bdd_variable_set()
+    update_functions: dict[str, Bdd] = {}
+    supports: dict[str, list[str]] = {}
+    for var in network.network_variable_names():
+        fn_bdd = network.mk_update_function(var)
+        if not (fn_bdd.is_true() or fn_bdd.is_false()):
+            update_functions[var] = fn_bdd
+            supports[var] = [
+                bdd_variables.get_variable_name(x) for x in fn_bdd.support_set()
+            ]
+    return (update_functions, supports)
+
+
+def _percolate_space_strict_bdd(
+    functions: _StrictUpdateFunctions, space: BooleanSpace
+) -> BooleanSpace:
+    """
+    Same as :func:`percolate_space_strict`, but using already prepared
+    update `functions`. Functions are only evaluated on their support.
+    """
+    update_functions, supports = functions
+
+    result: BooleanSpace = {}
+    restriction: BooleanSpace = copy(space)
+    candidates = set(update_functions.keys())
+
+    done = False
+    while not done:
+        done = True
+        for var in copy(candidates):
+            support_state: BooleanSpace = {
+                x: restriction[x] for x in supports[var] if x in restriction
+            }
+            if len(support_state) == 0:
+                # A non-constant function cannot be fixed by an empty restriction.
+                continue
+            fn_value = function_eval(update_functions[var], support_state)
+            if fn_value is not None:
+                if var in restriction and restriction[var] != fn_value:
+                    # There is a conflict. We don't want to output this,
+                    # but we also don't want to change the value.
+                    candidates.remove(var)
+                else:
+                    done = False
+                    restriction[var] = fn_value
+                    result[var] = fn_value
+                    candidates.remove(var)
+
+    return result
+
+
+_SMALL_NETWORK_LIMIT = 64
+
+# A list of `(mask, bits)` pairs. A clause is satisfiable in a space unless
+# some variable in `mask` is fixed to a value different from `bits`.
+_BitClauses = list[tuple[int, int]]
+
+# Variable names, the name-to-bit mapping, and `(bit, f, not f)` for every
+# update function that is not constant.
+_SmallNetwork = tuple[
+    list[str], dict[str, int], list[tuple[int, _BitClauses, _BitClauses]]
+]
+
+
+def _bdd_to_bit_clauses(bdd: Bdd, bits: dict[BddVariable, int]) -> _BitClauses:
+    clauses: _BitClauses = []
+    for clause in bdd.clause_iterator():
+        mask = 0
+        value = 0
+        for bdd_var, bdd_value in clause.items():
+            bit = bits[bdd_var]
+            mask |= bit
+            if bdd_value:
+                value |= bit
+        clauses.append((mask, value))
+    return clauses
+
+
+def _compile_small_network(network: AsynchronousGraph) -> _SmallNetwork | None:
+    """
+    Translate the update functions of a small network into bitmask clauses.
+
+    Returns `None` if the network has more than `_SMALL_NETWORK_LIMIT`
+    variables, or if its update functions depend on parameters.
+    """
+    compiled: _SmallNetwork | None = None
+    names = network.network_variable_names()
+    var_set = network.symbolic_context().bdd_variable_set()
+    if len(names) <= _SMALL_NETWORK_LIMIT and var_set.variable_count() == len(names):
+        index = {name: i for i, name in enumerate(names)}
+        bits: dict[BddVariable, int] = {}
+        for name, i in index.items():
+            bdd_var = var_set.find_variable(name)
+            assert bdd_var is not None
+            bits[bdd_var] = 1 << i
+
+        functions: list[tuple[int, _BitClauses, _BitClauses]] = []
+        for name in names:
+            fn_bdd = network.mk_update_function(name)
+            if fn_bdd.is_true() or fn_bdd.is_false():
+                continue
+            functions.append(
+                (
+                    index[name],
+                    _bdd_to_bit_clauses(fn_bdd, bits),
+                    _bdd_to_bit_clauses(fn_bdd.l_not(), bits),
+                )
+            )
+        compiled = (names, index, functions)
+
+    return compiled
+
+
+def _percolate_space_strict_small(
+    network: _SmallNetwork, space: BooleanSpace
+) -> BooleanSpace:
+    """
+    Same as :func:`percolate_space_strict`, but evaluated on bitmasks.
+
+    The space is encoded as two integers: `known` marks the fixed variables
+    and `value` stores their values. A function is fixed to `1` (resp. `0`)
+    once all clauses of its negation (resp. the function itself) are
+    contradicted by the known values.
+    """
+    names, index, functions = network
+
+    known = 0
+    value = 0
+    for var, var_value in space.items():
+        bit = 1 << index[var]
+        known |= bit
+        if var_value:
+            value |= bit
+
+    result: BooleanSpace = {}
+    candidates = functions
+    done = False
+    while not done:
+        done = True
+        remaining: list[tuple[int, _BitClauses, _BitClauses]] = []
+        for fn in candidates:
+            (i, fn_true, fn_false) = fn
+            if all((mask & known) & (bits ^ value) for mask, bits in fn_false):
+                fn_value: Literal[0, 1] = 1
+            elif all((mask & known) & (bits ^ value) for mask, bits in fn_true):
+                fn_value = 0
+            else:
+                remaining.append(fn)
+                continue
+
+            bit = 1 << i
+            if known & bit and ((value >> i) & 1) != fn_value:
+                # There is a conflict. We don't want to output this,
+                # but we also don't want to change the value.
+                continue
+
+            done = False
+            known |= bit
+            if fn_value:
+                value |= bit
+            result[names[i]] = fn_value
+        candidates = remaining
+
+    return result
@@ -3,11 +3,13 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Literal, cast
 
 if TYPE_CHECKING:
-    from typing import Iterator
+    from typing import Callable, Iterator
 
 import copy
+from concurrent.futures import ProcessPoolExecutor
+
 import networkx as nx  # type: ignore
-from biodivine_aeon import AsynchronousGraph, BooleanNetwork, VertexSet
+from biodivine_aeon import AsynchronousGraph, Bdd, BooleanNetwork, VertexSet
 
 # Attractor detection algorithms.
 from biobalm._sd_attractors.attractor_candidates import compute_attractor_candidates
@@ -89,6 +91,10 @@ class SuccessionDiagram:
         "dag",
         "node_indices",
         "config",
+        "_variable_indices",
+        "_max_depth",
+        "_minimal_traps",
+        "_motif_nodes",
     )
 
     def __init__(
@@ -111,6 +117,11 @@ class SuccessionDiagram:
         The symbolic representation of the network using `biodivine_aeon.AsynchronousGraph`.
         """
 
+        # Maps variable names to their indices in `self.network`. Used to
+        # compute space keys (and the variable count) without querying
+        # the network.
+        self._variable_indices = _variable_indices(self.network)
+
         self.petri_net: nx.DiGraph = network_to_petrinet(network)
         """
         The Petri net representation of the network (see :mod:`petri_net_translation<biobalm.petri_net_translation>`).
@@ -138,28 +149,59 @@ class SuccessionDiagram:
         diagram (see :func:`biobalm.space_utils.space_unique_key`).
         """
 
+        # The maximal node depth, updated whenever a node depth increases.
+        self._max_depth = 0
+
+        # Minimal trap spaces of the whole network, or `None` if not computed yet.
+        self._minimal_traps: list[BooleanSpace] | None = None
+
+        # Maps the keys of already percolated stable motifs to their nodes.
+        # Percolation is deterministic and nodes are never removed, so the same
+        # motif always leads to the same node.
+        self._motif_nodes: dict[int, int] = {}
+
         # Create an un-expanded root node.
         self._ensure_node(None, {})
 
     def __getstate__(self) -> SuccessionDiagramState:
         return {
             "network_rules": self.network.to_aeon(),
+            # The network was cleaned up in `__init__`.
+            "clean": True,
             "petri_net": self.petri_net,
             "nfvs": self.nfvs,
             "dag": self.dag,
             "node_indices": self.node_indices,
             "config": self.config,
+            "motif_nodes": self._motif_nodes,
         }
 
     def __setstate__(self, state: SuccessionDiagramState):
-        # In theory, the network should be cleaned-up at this point, but just in case...
-        self.network = cleanup_network(BooleanNetwork.from_aeon(state["network_rules"]))
+        # States produced by `__getstate__` contain an already cleaned-up
+        # network. Older (or hand-built) states are cleaned up just in case.
+        self.network = BooleanNetwork.from_aeon(state["network_rules"])
+        if not state.get("clean", False):
+            self.network = cleanup_network(self.network)
         self.symbolic = AsynchronousGraph(self.network)
+        self._variable_indices = _variable_indices(self.network)
         self.petri_net = state["petri_net"]
         self.nfvs = state["nfvs"]
         self.dag = state["dag"]
         self.node_indices = state["node_indices"]
         self.config = state["config"]
+        depths = cast("Iterator[tuple[int, int]]", self.dag.nodes(data="depth"))
+        self._max_depth = max((d for _, d in depths), default=0)
+        self._minimal_traps = None
+
+        # Diagrams pickled before `percolated_fvs` existed lack this field.
+        for _, data in self.dag.nodes(data=True):
+            data.setdefault("percolated_fvs", None)
+
+        # Older states do not store the percolated motifs. The root is always
+        # created from the empty motif, other motifs are percolated again.
+        # (Edge motifs cannot be used instead, since the motifs of edges
+        #  created by SCC expansion need not percolate to their child)
+        self._motif_nodes = state.get("motif_nodes", {0: 0})
 
     def __len__(self) -> int:
         """
@@ -177,6 +219,9 @@ class SuccessionDiagram:
             "attractor_candidates_limit": 100_000,
             "retained_set_optimization_threshold": 1_000,
             "minimum_simulation_budget": 1_000,
+            # Configurations created by older versions (e.g. in pickled
+            # diagrams) lack this key, hence it is always read using `get`.
+            "parallel_workers": 1,
         }
 
     @staticmethod
@@ -328,6 +373,14 @@ class SuccessionDiagram:
         1: {'A': 0, 'B': 0, 'C': 1}
         2: {'A': 1, 'B': 1, 'C': 1}
         """
+        if self.config.get("parallel_workers", 1) > 1:
+            missing = [
+                i
+                for i in self.expanded_ids()
+                if self.node_data(i)["attractor_seeds"] is None
+            ]
+            self._compute_attractor_seeds_parallel(missing)
+
         res: dict[int, list[BooleanSpace]] = {}
         for id in self.expanded_ids():
             atts = self.node_attractor_seeds(id, compute=True)
@@ -383,6 +436,14 @@ class SuccessionDiagram:
         1: VertexSet(cardinality=1, symbolic_size=5)
         2: VertexSet(cardinality=1, symbolic_size=5)
         """
+        if self.config.get("parallel_workers", 1) > 1:
+            missing = [
+                i
+                for i in self.expanded_ids()
+                if self.node_data(i)["attractor_sets"] is None
+            ]
+            self._compute_attractor_sets_parallel(missing)
+
         res: dict[int, list[VertexSet]] = {}
         for id in self.expanded_ids():
             atts = self.node_attractor_sets(id, compute=True)
@@ -396,14 +457,13 @@ class SuccessionDiagram:
         """
         Return a summary of the succession diagram as a string.
         """
-        var_ordering = sorted(
-            [self.network.get_variable_name(v) for v in self.network.variables()]
-        )
-        report_string = (
+        # The cached variable indices already contain all variable names.
+        var_ordering = sorted(self._variable_indices)
+        parts: list[str] = [
             f"Succession Diagram with {len(self)} nodes and depth {self.depth()}.\n"
             f"State order: {', '.join(var_ordering)}\n\n"
             "Attractors in diagram:\n\n"
-        )
+        ]
         for node in self.node_ids():
             try:
                 attrs = self.node_attractor_seeds(node, compute=False)
@@ -419,19 +479,16 @@ class SuccessionDiagram:
                 space_str_prefix = "minimal trap space "
             else:
                 space_str_prefix = "motif avoidance in "
-            space_str = ""
-            for var in var_ordering:
-                if var in space:
-                    space_str += str(space[var])
-                else:
-                    space_str += "*"
-            report_string += f"{space_str_prefix}{space_str}\n"
+            space_str = "".join(str(space.get(var, "*")) for var in var_ordering)
+            parts.append(f"{space_str_prefix}{space_str}\n")
+            attr_prefix = "." * len(space_str_prefix)
             for attr in attrs:
-                attr_str = "".join(str(v) for _, v in sorted(attr.items()))
-                report_string += "." * len(space_str_prefix) + f"{attr_str}\n"
-            report_string += "\n"
+                # Attractor seeds are full states, i.e. they fix every variable.
+                attr_str = "".join(str(attr[var]) for var in var_ordering)
+                parts.append(f"{attr_prefix}{attr_str}\n")
+            parts.append("\n")
         # remove final extra newline and return
-        return report_string[:-1]
+        return "".join(parts)[:-1]
 
     def root(self) -> int:
         """
@@ -445,32 +502,41 @@ class SuccessionDiagram:
 
         Depth is counted from zero (root has depth zero).
         """
-        d = 0
-        for node in cast(set[int], self.dag.nodes()):
-            d = max(d, self.node_data(int(node))["depth"])
-        return d
+        return self._max_depth
 
     def node_ids(self) -> Iterator[int]:
         """
         Iterator over all available node IDs.
         """
-        for i in range(len(self)):
-            yield i
+        return iter(range(len(self)))
 
     def stub_ids(self) -> Iterator[int]:
         """
         Iterator over all node IDs that are currently *not* expanded.
         """
-        for i in range(len(self)):
-            if not self.node_data(i)["expanded"]:
+        for i, expanded in self._expanded_flags():
+            if not expanded:
                 yield i
 
     def expanded_ids(self) -> Iterator[int]:
         """
         Iterator over all node IDs that are currently expanded.
         """
-        for i in range(len(self)):
-            if self.node_data(i)["expanded"]:
+        for i, expanded in self._expanded_flags():
+            if expanded:
+                yield i
+
+    def reversed_expanded_ids(self) -> Iterator[int]:
+        """
+        Iterator over all expanded node IDs, starting with the most recently
+        created node.
+
+        Same as `reversed(list(self.expanded_ids()))`, but the list of IDs is
+        never materialized.
+        """
+        nodes = self.dag.nodes
+        for i in range(len(self) - 1, -1, -1):
+            if nodes[i]["expanded"]:
                 yield i
 
     def minimal_trap_spaces(self) -> list[int]:
@@ -480,7 +546,8 @@ class SuccessionDiagram:
 
         Note that stub nodes do not count as minimal!
         """
-        return [i for i in self.expanded_ids() if self.node_is_minimal(i)]
+        successors = self.dag.succ
+        return [i for i in self.expanded_ids() if len(successors[i]) == 0]
 
     def find_node(self, node_space: BooleanSpace) -> int | None:
         """
@@ -499,11 +566,8 @@ class SuccessionDiagram:
             if no such node exists in this succession diagram.
         """
         try:
-            key = space_unique_key(node_space, self.network)  # throws IndexError
-            if key in self.node_indices:
-                return self.node_indices[key]
-            else:
-                return None
+            key = space_unique_key(node_space, self._variable_indices)
+            return self.node_indices.get(key)
         except IndexError:
             # If `space_unique_key` finds a variable that does not exist in this
             # `SuccessionDiagram`, it throws an `IndexError`. This can happen
@@ -535,20 +599,33 @@ class SuccessionDiagram:
             `True` if this succession diagram is a subgraph of the `other`
             succession diagram.
         """
+        # Maps node IDs of this diagram to the matching node IDs in `other`.
+        # Each node is looked up at most once, even if it has many parents.
+        other_ids: dict[int, int | None] = {}
+
+        if self._variable_indices == other._variable_indices:
+            # Both diagrams assign the same key to the same space, hence the
+            # keys of this diagram can be used directly in the `other` diagram.
+            for key, node_id in self.node_indices.items():
+                other_ids[node_id] = other.node_indices.get(key)
+
+        def other_id(node_id: int) -> int | None:
+            if node_id not in other_ids:
+                other_ids[node_id] = other.find_node(self.node_data(node_id)["space"])
+            return other_ids[node_id]
+
         # Every stub node is reachable through an expanded node and
         # thus will be checked by the following code.
         for i in self.expanded_ids():
-            other_i = other.find_node(self.node_data(i)["space"])
+            other_i = other_id(i)
             if other_i is None:
                 return False
-            my_successors = self.node_successors(i)
-            other_successors = []
+            other_successors: set[int] = set()
             if other.node_data(other_i)["expanded"]:
-                other_successors = other.node_successors(other_i)
+                other_successors = set(other.dag.successors(other_i))
 
-            for my_s in my_successors:
-                other_s = other.find_node(self.node_data(my_s)["space"])
-                if other_s not in other_successors:
+            for my_s in self.dag.successors(i):
+                if other_id(my_s) not in other_successors:
                     return False
         return True
 
@@ -589,6 +666,8 @@ class SuccessionDiagram:
         `SuccessionDiagram.network` with respect to the node's `space`.
         - `percolated_petri_net`: [`None` if not computed] The percolation of
         `SuccessionDiagram.petri_net` with respect to the node's `space`.
+        - `percolated_fvs`: [`None` if not computed] The (unsigned) FVS of
+        `percolated_network`.
         - `percolated_nfvs`: [`None` if not computed] The NFVS of `percolated_network`.
         - `attractor_candidates`: [`None` if not computed] A collection of states
         that collectively cover every attractor of this node.
@@ -622,19 +701,41 @@ class SuccessionDiagram:
         to be re-computed.
 
         The method removes the `percolated_network`, `percolated_petri_net`,
-        and the `percolated_nfvs`. Furthermore, if `attractor_seeds` are known,
+        and the `percolated_fvs`/`percolated_nfvs`. Furthermore, if `attractor_seeds` are known,
         it erases the `attractor_candidates`, since seeds can be used for the
         same tasks.
         """
 
-        for node_id in self.node_ids():
-            data = self.node_data(node_id)
+        # The keys must stay present, since `NodeData` fields are accessed
+        # directly elsewhere.
+        for _, data in self.dag.nodes(data=True):
             data["percolated_network"] = None
             data["percolated_petri_net"] = None
+            data["percolated_fvs"] = None
             data["percolated_nfvs"] = None
             if data["attractor_seeds"] is not None:
                 data["attractor_candidates"] = None
 
+    def release_percolated_caches(self, node_id: int):
+        """
+        Removes the `percolated_network`, `percolated_petri_net`, and the
+        `percolated_fvs`/`percolated_nfvs` of a single node.
+
+        This is useful once these objects are no longer needed for the
+        attractor computation in this node. They are re-computed if they
+        are needed again later.
+
+        Parameters
+        ----------
+        node_id: int
+            The ID of the node.
+        """
+        node = self.node_data(node_id)
+        node["percolated_network"] = None
+        node["percolated_petri_net"] = None
+        node["percolated_fvs"] = None
+        node["percolated_nfvs"] = None
+
     def node_is_minimal(self, node_id: int) -> bool:
         """
         True if the node represents a minimal trap space.
@@ -837,9 +938,7 @@ class SuccessionDiagram:
             # Release memory once attractor seeds are known. We might need these
             # for attractor set computation later, but only if the seeds are not empty.
             if len(seeds) == 0:
-                node["percolated_network"] = None
-                node["percolated_nfvs"] = None
-                node["percolated_petri_net"] = None
+                self.release_percolated_caches(node_id)
 
         return seeds
 
@@ -853,7 +952,8 @@ class SuccessionDiagram:
 
         Similar to :meth:`node_successors`, the method either computes the
         data if unknown, or throws an exception, depending on the `compute`
-        flag.
+        flag. If the node is already known to have no attractor seeds, the
+        empty list is returned regardless of `compute`.
 
         Note that the same considerations regarding attractors in unexpanded
         nodes apply as for :meth:`node_attractor_candidates`.
@@ -874,27 +974,44 @@ class SuccessionDiagram:
 
         sets = node["attractor_sets"]
 
+        if sets is None and node["attractor_seeds"] == []:
+            # Without seeds, there are no attractors. No need to compute anything.
+            sets = []
+            node["attractor_sets"] = sets
+            return sets
+
         if sets is None and not compute:
             raise KeyError(f"Attractor sets not computed for node {node_id}.")
 
         if sets is None:
             seeds = self.node_attractor_seeds(node_id, compute=True)
-            result: tuple[list[BooleanSpace], list[VertexSet] | None] = ([], [])
+            sets = []
             if len(seeds) > 0:
                 result = compute_attractors_symbolic(
                     self, node_id, candidate_states=seeds
                 )
-            assert result[1] is not None
-            node["attractor_sets"] = result[1]
-            sets = result[1]
+                assert result[1] is not None
+                sets = result[1]
+            node["attractor_sets"] = sets
 
         return sets
 
-    def node_percolated_nfvs(self, node_id: int, compute: bool = False) -> list[str]:
+    def node_percolated_nfvs(
+        self,
+        node_id: int,
+        compute: bool = False,
+        parity: Literal["negative"] | None = "negative",
+    ) -> list[str]:
         """
         Approximate minimum negative feedback vertex set on the Boolean network
         percolated to the node's sub-space.
 
+        Computing the negative variant is costly, so it is only computed for
+        networks below the `nfvs_size_threshold`. For larger networks, the
+        unsigned FVS (which is also a valid NFVS) is returned instead. With
+        `parity=None`, the cheaper unsigned FVS is returned directly. Both
+        variants are cached separately in the node data.
+
         Similar to :meth:`node_successors`, the method either computes the
         data if unknown, or throws an exception, depending on the `compute`
         flag.
@@ -907,35 +1024,45 @@ class SuccessionDiagram:
         node_id: int
             The ID of the node.
         compute: bool
-            Whether to compute the node NFVS if it is not already known.
+            Whether to compute the node FVS/NFVS if it is not already known.
+        parity: Literal["negative"] | None
+            Set to `None` to request the unsigned FVS. Default: `"negative"`.
 
         Returns
         -------
         list[str]
-            The negative feedback vertex set, as a list of node names.
+            The (negative) feedback vertex set, as a list of node names.
         """
 
         assert node_id in self.dag.nodes
 
         node = self.node_data(node_id)
 
-        if node["percolated_nfvs"] is None and not compute:
-            raise KeyError(f"NFVS not computed for node {node_id}.")
+        if parity == "negative" and node["percolated_nfvs"] is not None:
+            return node["percolated_nfvs"]
 
-        if node["percolated_nfvs"] is None:
-            percolated_network = self.node_percolated_network(node_id, compute)
-            percolated_size = percolated_network.variable_count()
-            if percolated_size < self.config["nfvs_size_threshold"]:
-                # Computing the *negative* variant of the FVS is surprisingly costly.
-                # Hence it mostly makes sense for the smaller networks only.
-                nfvs = feedback_vertex_set(percolated_network, parity="negative")
-            else:
-                nfvs = feedback_vertex_set(percolated_network)
-            node["percolated_nfvs"] = nfvs
-        else:
-            nfvs = node["percolated_nfvs"]
+        fvs = node["percolated_fvs"]
+
+        if parity == "negative" or fvs is None:
+            if not compute:
+                raise KeyError(f"NFVS not computed for node {node_id}.")
 
-        return nfvs
+            percolated_network = self.node_percolated_network(node_id, compute)
+            if parity == "negative":
+                percolated_size = percolated_network.variable_count()
+                if percolated_size < self.config["nfvs_size_threshold"]:
+                    # Computing the *negative* variant of the FVS is surprisingly costly.
+                    # Hence it mostly makes sense for the smaller networks only.
+                    nfvs = feedback_vertex_set(percolated_network, parity="negative")
+                    node["percolated_nfvs"] = nfvs
+                    return nfvs
+            if fvs is None:
+                fvs = feedback_vertex_set(percolated_network)
+                node["percolated_fvs"] = fvs
+            if parity == "negative":
+                node["percolated_nfvs"] = fvs
+
+        return fvs
 
     def node_percolated_network(
         self, node_id: int, compute: bool = False
@@ -968,7 +1095,7 @@ class SuccessionDiagram:
 
         node_space = node["space"]
 
-        if len(node_space) == self.network.variable_count():
+        if len(node_space) == len(self._variable_indices):
             # If fixed point, no need to compute, the network is always empty.
             return BooleanNetwork()
 
@@ -976,9 +1103,28 @@ class SuccessionDiagram:
             raise KeyError(f"Percolated network not computed for node {node_id}.")
 
         if network is None:
-            network = percolate_network(
-                self.network, node_space, self.symbolic, remove_constants=True
-            )
+            # If some parent already has a percolated network, only the
+            # variables that are not fixed by the parent need to be percolated.
+            # Otherwise, start from the full network.
+            parent_network = None
+            for parent_id in self.dag.predecessors(node_id):
+                parent_network = self.node_data(parent_id)["percolated_network"]
+                if parent_network is not None:
+                    break
+
+            if parent_network is not None:
+                parent_space: BooleanSpace = {
+                    var: value
+                    for var, value in node_space.items()
+                    if parent_network.find_variable(var) is not None
+                }
+                network = percolate_network(
+                    parent_network, parent_space, remove_constants=True
+                )
+            else:
+                network = percolate_network(
+                    self.network, node_space, self.symbolic, remove_constants=True
+                )
             if self.config["debug"]:
                 print(
                     f"[{node_id}] Computed percolated network with {network.variable_count()} variables (vs {self.network.variable_count()})."
@@ -1026,7 +1172,7 @@ class SuccessionDiagram:
 
         node_space = node["space"]
 
-        if len(node_space) == self.network.variable_count():
+        if len(node_space) == len(self._variable_indices):
             # If fixed point, the result is always empty.
             return nx.DiGraph()
 
@@ -1034,15 +1180,13 @@ class SuccessionDiagram:
             raise KeyError(f"Percolated network not computed for node {node_id}.")
 
         if percolated_pn is None:
-            base_pn = self.petri_net
-            percolate_space = node_space
-            if parent_id is not None:
-                parent_pn = self.node_data(parent_id)["percolated_petri_net"]
-                if parent_pn is not None:
-                    base_pn = parent_pn
-                    percolate_space = node_space
+            # Restriction is idempotent on variables fixed by an ancestor, so
+            # we can start from the nearest ancestor with a cached Petri net.
+            base_pn = self._ancestor_petri_net(node_id, parent_id)
+            if base_pn is None:
+                base_pn = self.petri_net
 
-            percolated_pn = restrict_petrinet_to_subspace(base_pn, percolate_space)
+            percolated_pn = restrict_petrinet_to_subspace(base_pn, node_space)
 
             if self.config["debug"]:
                 print(
@@ -1053,6 +1197,34 @@ class SuccessionDiagram:
 
         return percolated_pn
 
+    def _ancestor_petri_net(
+        self, node_id: int, parent_id: int | None = None
+    ) -> nx.DiGraph | None:
+        """
+        An internal method that finds the percolated Petri net of the nearest
+        ancestor of `node_id` that has one cached, preferring `parent_id` if
+        given.
+
+        The search follows one path towards the root, hence it takes at most
+        `SuccessionDiagram.depth` steps. Returns `None` if no Petri net
+        is found.
+        """
+        if parent_id is not None:
+            parent_pn = self.node_data(parent_id)["percolated_petri_net"]
+            if parent_pn is not None:
+                return parent_pn
+
+        current = node_id
+        while True:
+            parents = list(self.dag.predecessors(current))
+            if len(parents) == 0:
+                return None
+            for p in parents:
+                pn = self.node_data(p)["percolated_petri_net"]
+                if pn is not None:
+                    return pn
+            current = parents[0]
+
     def edge_stable_motif(
         self, parent_id: int, child_id: int, reduced: bool = False
     ) -> BooleanSpace:
@@ -1082,17 +1254,12 @@ class SuccessionDiagram:
             The stable motif (maximal trap space) represented by the edge.
         """
 
+        motif = cast(BooleanSpace, self.dag.edges[parent_id, child_id]["motif"])
         if reduced:
-            return cast(
-                BooleanSpace,
-                {
-                    k: v
-                    for k, v in self.dag.edges[parent_id, child_id]["motif"].items()  # type: ignore
-                    if k not in self.node_data(parent_id)["space"]
-                },
-            )
+            parent_space = self.node_data(parent_id)["space"]
+            return {k: v for k, v in motif.items() if k not in parent_space}
         else:
-            return cast(BooleanSpace, self.dag.edges[parent_id, child_id]["motif"])
+            return motif
 
     def component_subdiagram(
         self,
@@ -1180,9 +1347,24 @@ class SuccessionDiagram:
         Expand the succession diagram and search for attractors using default methods.
         """
         self.expand_scc()
+        if self.config.get("parallel_workers", 1) > 1:
+            missing = [
+                i
+                for i in self.node_ids()
+                if self.node_data(i)["attractor_seeds"] is None
+            ]
+            self._compute_attractor_seeds_parallel(missing)
         for node_id in self.node_ids():
             self.node_attractor_seeds(node_id, compute=True)
 
+        # Percolated networks of parent nodes are used to derive the networks
+        # of their children, so they can only be released once all seeds are
+        # known. After that, they are only needed for nodes that still
+        # require attractor set computation.
+        for node_id in self.node_ids():
+            if self.node_data(node_id)["attractor_sets"] is not None:
+                self.release_percolated_caches(node_id)
+
     def expand_scc(self, find_motif_avoidant_attractors: bool = True) -> bool:
         """
         Expand the succession diagram using the source SCC method.
@@ -1299,6 +1481,77 @@ class SuccessionDiagram:
         """
         return expand_to_target(self, target, size_limit)
 
+    def _expanded_flags(self) -> Iterator[tuple[int, bool]]:
+        """
+        An internal method that iterates over `(node_id, expanded)` pairs.
+
+        Same as iterating over `range(len(self))`, only nodes that exist when
+        the iteration starts are considered, and the flags are read lazily.
+        Hence, the diagram can be expanded while iterating.
+        """
+        # Resolve the node view once, instead of going through `node_data`.
+        nodes = self.dag.nodes
+        for i in range(len(self)):
+            yield i, cast(bool, nodes[i]["expanded"])
+
+    def _compute_attractor_sets_parallel(self, node_ids: list[int]):
+        """
+        An internal method that computes the attractor sets of the given nodes
+        using `SuccessionDiagramConfiguration.parallel_workers` processes.
+
+        See :meth:`_compute_attractors_parallel` for details.
+        """
+        self._compute_attractors_parallel(node_ids, _attractor_worker_sets)
+
+    def _compute_attractor_seeds_parallel(self, node_ids: list[int]):
+        """
+        An internal method that computes the attractor seeds of the given nodes
+        using `SuccessionDiagramConfiguration.parallel_workers` processes.
+
+        See :meth:`_compute_attractors_parallel` for details.
+        """
+        self._compute_attractors_parallel(node_ids, _attractor_worker_seeds)
+
+    def _compute_attractors_parallel(
+        self,
+        node_ids: list[int],
+        worker: Callable[[int], _AttractorWorkerResult],
+    ):
+        """
+        An internal method that runs the given attractor `worker` for each of
+        the given nodes using `SuccessionDiagramConfiguration.parallel_workers`
+        processes.
+
+        Each worker receives a copy of this diagram once. The results
+        (attractor candidates, seeds, and sets, if known) are then stored in the
+        `NodeData` of this diagram. Attractor sets are transferred as `Bdd`
+        objects, because `VertexSet` objects cannot be pickled.
+        """
+        workers = min(self.config.get("parallel_workers", 1), len(node_ids))
+        if workers <= 1:
+            return
+
+        # Attractor sets cannot be pickled, and are not needed by the workers.
+        state = self.__getstate__()
+        dag = state["dag"].copy()
+        for node_id in dag.nodes():
+            dag.nodes[node_id]["attractor_sets"] = None
+        state["dag"] = dag
+
+        context = self.symbolic.symbolic_context()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_attractor_worker_init,
+            initargs=(state,),
+        ) as executor:
+            for node_id, candidates, seeds, sets in executor.map(worker, node_ids):
+                node = self.node_data(node_id)
+                if node["attractor_candidates"] is None:
+                    node["attractor_candidates"] = candidates
+                node["attractor_seeds"] = seeds
+                if sets is not None:
+                    node["attractor_sets"] = [VertexSet(context, bdd) for bdd in sets]
+
     def _update_node_depth(self, node_id: int, parent_id: int):
         """
         An internal method that updates the depth of a node based on a specific
@@ -1307,10 +1560,14 @@ class SuccessionDiagram:
 
         Note that the depth can only increase.
         """
-        assert self.dag.edges[parent_id, node_id] is not None
-        parent_depth = cast(int, self.dag.nodes[parent_id]["depth"])
-        current_depth = cast(int, self.dag.nodes[node_id]["depth"])
-        self.dag.nodes[node_id]["depth"] = max(current_depth, parent_depth + 1)
+        assert self.dag.has_edge(parent_id, node_id)
+        nodes = self.dag.nodes
+        node = nodes[node_id]
+        parent_depth = cast(int, nodes[parent_id]["depth"])
+        current_depth = cast(int, node["depth"])
+        new_depth = max(current_depth, parent_depth + 1)
+        node["depth"] = new_depth
+        self._max_depth = max(self._max_depth, new_depth)
 
     def _expand_one_node(self, node_id: int):
         """
@@ -1322,33 +1579,34 @@ class SuccessionDiagram:
         If the node is already expanded, the method does nothing.
 
         If there are already some attractor data for this node (stub nodes can
-        have associated attractor data), this data is erased.
+        have associated attractor data), this data is erased (unless the node
+        is a fixed-point).
         """
         node = cast(dict[str, Any], self.dag.nodes[node_id])
         if node["expanded"]:
             return
 
-        # If the node had any attractor data computed as unexpanded, these are
-        # no longer valid and need to be erased.
-        node["attractor_seeds"] = None
-        node["attractor_candidates"] = None
-        node["attractor_sets"] = None
-
         current_space = node["space"]
 
-        if self.config["debug"]:
-            print(
-                f"[{node_id}] Expanding: {len(self.node_data(node_id)['space'])} fixed vars."
-            )
-
-        if len(current_space) == self.network.variable_count():
+        if len(current_space) == len(self._variable_indices):
             # This node is a fixed-point. Trappist would just
             # return this fixed-point again. No need to continue.
+            # Any attractor data of the node stay valid, since a fixed-point
+            # has no children.
             if self.config["debug"]:
                 print(f"[{node_id}] Found fixed-point: {current_space}.")
             node["expanded"] = True
             return
 
+        # If the node had any attractor data computed as unexpanded, these are
+        # no longer valid and need to be erased.
+        node["attractor_seeds"] = None
+        node["attractor_candidates"] = None
+        node["attractor_sets"] = None
+
+        if self.config["debug"]:
+            print(f"[{node_id}] Expanding: {len(current_space)} fixed vars.")
+
         # We use the non-propagated Petri net for backwards-compatibility reasons here.
         # The SD created from the restricted Petri net is technically correct, but can
         # propagate some of the input values further and yields a smaller SD.
@@ -1393,22 +1651,27 @@ class SuccessionDiagram:
             )
 
         # Sort the spaces based on a unique key in case trappist is not always
-        # sorted deterministically.
-        sub_spaces = sorted(
-            sub_spaces, key=lambda space: space_unique_key(space, self.network)
+        # sorted deterministically. The keys are then reused by `_ensure_node`
+        # for spaces that do not percolate any further.
+        keyed_sub_spaces = sorted(
+            (
+                (space_unique_key(space, self._variable_indices), space)
+                for space in sub_spaces
+            ),
+            key=lambda item: item[0],
         )
 
-        if len(sub_spaces) == 0:
+        if len(keyed_sub_spaces) == 0:
             if self.config["debug"]:
                 print(f"[{node_id}] Found minimum trap space: {current_space}.")
             node["expanded"] = True
             return
 
         if self.config["debug"]:
-            print(f"[{node_id}] Found sub-spaces: {len(sub_spaces)}")
+            print(f"[{node_id}] Found sub-spaces: {len(keyed_sub_spaces)}")
 
-        for sub_space in sub_spaces:
-            child_id = self._ensure_node(node_id, sub_space)
+        for sub_space_key, sub_space in keyed_sub_spaces:
+            child_id = self._ensure_node(node_id, sub_space, sub_space_key)
 
             if self.config["debug"]:
                 print(f"[{node_id}] Created edge into node {child_id}.")
@@ -1416,7 +1679,21 @@ class SuccessionDiagram:
         # If everything else worked out, we can mark the node as expanded.
         node["expanded"] = True
 
-    def _ensure_node(self, parent_id: int | None, stable_motif: BooleanSpace) -> int:
+    def _network_minimal_traps(self) -> list[BooleanSpace]:
+        """
+        The minimal trap spaces of the whole network, computed on first use
+        and cached afterwards. The returned list must not be modified.
+        """
+        if self._minimal_traps is None:
+            self._minimal_traps = trappist(self.petri_net, problem="min")
+        return self._minimal_traps
+
+    def _ensure_node(
+        self,
+        parent_id: int | None,
+        stable_motif: BooleanSpace,
+        motif_key: int | None = None,
+    ) -> int:
         """
         Internal method that ensures the provided node is present in this
         succession diagram as a child of the given `parent_id`.
@@ -1427,14 +1704,49 @@ class SuccessionDiagram:
 
         If the `parent_id` is not given, no edge is created and depth is
         considered to be zero (i.e. the node is the root).
+
+        If the `motif_key` of the `stable_motif` is already known, it is reused
+        when the motif does not percolate any further. Motifs that were already
+        seen are not percolated again.
+        """
+
+        if motif_key is None:
+            motif_key = space_unique_key(stable_motif, self._variable_indices)
+
+        child_id = self._motif_nodes.get(motif_key)
+        if child_id is None:
+            child_id = self._percolated_motif_node(stable_motif, motif_key)
+            self._motif_nodes[motif_key] = child_id
+
+        if parent_id is not None:
+            self._ensure_edge(parent_id, child_id, stable_motif)
+
+        # Compute the percolated petri net here, because we know the parent node ID
+        # and using its already percolated petri net helps a lot.
+        #
+        # (The percolated network and nfvs are computed lazily. The network is
+        #  then derived from the percolated network of any parent that still has
+        #  it, see `node_percolated_network`)
+        self.node_percolated_petri_net(child_id, compute=True, parent_id=parent_id)
+
+        return child_id
+
+    def _percolated_motif_node(self, stable_motif: BooleanSpace, motif_key: int) -> int:
+        """
+        Internal method that percolates the `stable_motif` and returns the ID
+        of the node with the resulting space, creating the node if necessary.
         """
 
         fixed_vars = percolate_space(self.symbolic, stable_motif)
 
-        key = space_unique_key(fixed_vars, self.network)
+        # Percolating a trap space can only add new variables.
+        if len(fixed_vars) == len(stable_motif):
+            key = motif_key
+        else:
+            key = space_unique_key(fixed_vars, self._variable_indices)
 
-        child_id = None
-        if key not in self.node_indices:
+        child_id = self.node_indices.get(key)
+        if child_id is None:
             child_id = self.dag.number_of_nodes()
 
             # Note: this must match the fields of the `NodeData` class
@@ -1445,26 +1757,13 @@ class SuccessionDiagram:
                 expanded=False,
                 percolated_network=None,
                 percolated_petri_net=None,
+                percolated_fvs=None,
                 percolated_nfvs=None,
                 attractor_candidates=None,
                 attractor_seeds=None,
                 attractor_sets=None,
             )
             self.node_indices[key] = child_id
-        else:
-            child_id = self.node_indices[key]
-
-        assert child_id is not None
-
-        if parent_id is not None:
-            self._ensure_edge(parent_id, child_id, stable_motif)
-
-        # Compute the percolated petri net here, because we know the parent node ID
-        # and using its already percolated petri net helps a lot.
-        #
-        # (For percolated network and nfvs, knowing the parent ID is not as useful,
-        #  so the parent is not used and we can just compute them lazily)
-        self.node_percolated_petri_net(child_id, compute=True, parent_id=parent_id)
 
         return child_id
 
@@ -1472,5 +1771,53 @@ class SuccessionDiagram:
         # TODO: It seems that there are some networks where the same child
         # can be reached through multiple stable motifs. Not sure how to
         # approach these... but this is probably good enough for now.
+
+        # Most stable motifs do not percolate any further, in which case
+        # the edge shares the space object of the child node to save memory.
+        child_space = self.node_data(child_id)["space"]
+        if stable_motif == child_space:
+            stable_motif = child_space
         self.dag.add_edge(parent_id, child_id, motif=stable_motif)  # type: ignore
         self._update_node_depth(child_id, parent_id)
+
+
+def _variable_indices(network: BooleanNetwork) -> dict[str, int]:
+    return {network.get_variable_name(var): int(var) for var in network.variables()}
+
+
+# The succession diagram used by the attractor workers in a worker process
+# of `SuccessionDiagram._compute_attractors_parallel`.
+_worker_sd: SuccessionDiagram | None = None
+
+# Node ID, attractor candidates, seeds, and sets (if known) computed by a worker.
+_AttractorWorkerResult = tuple[
+    int, list[BooleanSpace] | None, list[BooleanSpace], list[Bdd] | None
+]
+
+
+def _attractor_worker_init(state: SuccessionDiagramState):
+    global _worker_sd
+    _worker_sd = SuccessionDiagram.__new__(SuccessionDiagram)
+    _worker_sd.__setstate__(state)
+
+
+def _attractor_worker_sets(node_id: int) -> _AttractorWorkerResult:
+    assert _worker_sd is not None
+    _worker_sd.node_attractor_sets(node_id, compute=True)
+    return _attractor_worker_result(node_id)
+
+
+def _attractor_worker_seeds(node_id: int) -> _AttractorWorkerResult:
+    assert _worker_sd is not None
+    _worker_sd.node_attractor_seeds(node_id, compute=True)
+    return _attractor_worker_result(node_id)
+
+
+def _attractor_worker_result(node_id: int) -> _AttractorWorkerResult:
+    assert _worker_sd is not None
+    node = _worker_sd.node_data(node_id)
+    seeds = node["attractor_seeds"]
+    assert seeds is not None
+    sets = node["attractor_sets"]
+    bdds = None if sets is None else [s.to_bdd() for s in sets]
+    return (node_id, node["attractor_candidates"], seeds, bdds)
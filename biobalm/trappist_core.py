@@ -18,7 +18,7 @@ if TYPE_CHECKING:
     from biobalm.types import BooleanSpace
 
 from biodivine_aeon import BooleanNetwork
-from clingo import Control, SolveHandle
+from clingo import Control, Function, SolveHandle
 from networkx import DiGraph  # type: ignore
 
 from biobalm.petri_net_translation import (
@@ -183,8 +183,9 @@ def trappist(
 def _clingo_model_to_space(model: Model) -> BooleanSpace:
     space: BooleanSpace = {}
     for atom in model.symbols(atoms=True):
-        atom_str = str(atom)
-        (variable, is_positive) = place_to_variable(atom_str)
+        # All atoms are plain constants, so their name is the whole atom
+        # (and it is much cheaper to obtain than `str(atom)`).
+        (variable, is_positive) = place_to_variable(atom.name)
         # This should be prevented by the "conflic-free" property of the result,
         # but just in case.
         assert variable not in space
@@ -192,7 +193,6 @@ def _clingo_model_to_space(model: Model) -> BooleanSpace:
         # appears in the solution, we want to fix the value to 0. This is indeed
         # the intended behaviour of the algorithm.
         space[variable] = 0 if is_positive else 1
-        space[variable] = 0 if is_positive else 1
     return space
 
 
@@ -229,31 +229,34 @@ def _create_clingo_constraints(
     # TODO: Explain what remaining options mean and why we need them?
     ctl = Control(["0", "--heuristic=Domain", "--enum-mod=domRec", dom_mod])
 
+    # All rules are collected first and then parsed by clingo at once.
+    program: list[str] = []
+
     # Declare places and their conflicts based on network variables.
     for var_name in variables:
         p_name = variable_to_place(var_name, positive=True)
         n_name = variable_to_place(var_name, positive=False)
         # Declare a positive and negative symbol.
-        ctl.add(f"{{{p_name}}}.")
-        ctl.add(f"{{{n_name}}}.")
+        program.append(f"{{{p_name}}}.")
+        program.append(f"{{{n_name}}}.")
         # Assert there is no conflict (we can't have both true simultaneously).
-        ctl.add(f":- {p_name}, {n_name}.")
+        program.append(f":- {p_name}, {n_name}.")
         # If we are computing fixed points, assert also that at least one should hold.
         if problem == "fix":
-            ctl.add(f"{p_name} ; {n_name}.")
+            program.append(f"{p_name} ; {n_name}.")
 
     # Ensure that solutions must have desired variables fixed based on `ensure_subspace`.
     for fixed_var in ensure_subspace:
         positive = True
         if ensure_subspace[fixed_var] == 1:
             positive = False
-        ctl.add(f"{variable_to_place(fixed_var, positive)}.")
+        program.append(f"{variable_to_place(fixed_var, positive)}.")
 
     # Ensure that solutions can't have variables fixed based on either subspace in `avoid_subspaces`.
     for to_avoid in avoid_subspaces:
         fixed_list = [variable_to_place(var, (to_avoid[var] != 1)) for var in to_avoid]
         fixed_vars = ", ".join(fixed_list)
-        ctl.add(f":- {fixed_vars}.")
+        program.append(f":- {fixed_vars}.")
 
     free_places: list[str] = []
     for node, kind in petri_net.nodes(data="kind"):  # type: ignore # noqa
@@ -270,14 +273,14 @@ def _create_clingo_constraints(
                     if (
                         successor not in predecessors
                     ):  # optimize obvious tautologies # noqa
-                        ctl.add(f"{p_disjunction} :- {successor}.")
+                        program.append(f"{p_disjunction} :- {successor}.")
             else:
                 # Compute traps.
                 successors = list(petri_net.successors(node))  # type: ignore # noqa
                 s_disjunction = "; ".join(successors)  # type: ignore # noqa
                 for predecessor in petri_net.predecessors(node):  # type: ignore # noqa
                     if predecessor not in successors:
-                        ctl.add(f"{s_disjunction} :- {predecessor}.")
+                        program.append(f"{s_disjunction} :- {predecessor}.")
         else:
             raise Exception(f"Unexpected node kind: `{kind}`.")
 
@@ -285,19 +288,25 @@ def _create_clingo_constraints(
     if problem == "max" and len(free_places) > 0:
         # Only spaces which are not fixed but the `ensure_subspace` are considered here.
         max_condition = "; ".join(free_places)
-        ctl.add(f"{max_condition}.")
+        program.append(f"{max_condition}.")
 
         # Additionally, we require source nodes to not appear as `*` when `problem=max`, since this is
         # largely useless in practice.
         for variable in optimize_source_variables:
             if variable not in ensure_subspace:
-                ctl.add(
+                program.append(
                     f"{variable_to_place(variable, True)}; {variable_to_place(variable, False)}."
                 )
 
+    ctl.add("\n".join(program))
     return ctl
 
 
+# Prefix of the external atoms that implement retained sets in the ASP program
+# (see `fixed_point_reduced_STG_solver`).
+_RETAIN_PREFIX = "retain_"
+
+
 def _clingo_model_to_fixed_point(model: Model) -> BooleanSpace:
     """
     Convert a clingo `Model` to a subspace representing a single fixed point.
@@ -310,8 +319,13 @@ def _clingo_model_to_fixed_point(model: Model) -> BooleanSpace:
     space: BooleanSpace = {}
 
     for atom in model.symbols(atoms=True):
-        atom_str = str(atom)
-        (variable, is_positive) = place_to_variable(atom_str)
+        # See `_clingo_model_to_space` for why `atom.name` is used.
+        atom_name = atom.name
+        if atom_name.startswith(_RETAIN_PREFIX):
+            # Retained set switches are not part of the state
+            # (see `fixed_point_reduced_STG_solver`).
+            continue
+        (variable, is_positive) = place_to_variable(atom_name)
 
         # This should be prevented by the "conflic-free" property of the result,
         # but just in case.
@@ -331,15 +345,27 @@ def _create_clingo_fixed_point_constraints(
     petri_net: DiGraph,
     ensure_subspace: BooleanSpace | None = None,
     avoid_subspaces: list[BooleanSpace] | None = None,
+    retain_externals: bool = False,
+    excluded_transitions: set[str] | None = None,
 ) -> Control:
     """
     Generate the ASP characterizing all deadlocks of the Petri net (equivalently all
     fixed points of the Boolean network).
+
+    If `retain_externals` is set, every transition is guarded by an external
+    atom of the place that it consumes. Setting this atom to true removes
+    the transition, the same way a retained set does in
+    :func:`compute_fixed_point_reduced_STG_async`.
+
+    The `excluded_transitions` are treated as if they were removed from the
+    Petri net.
     """
     if ensure_subspace is None:
         ensure_subspace = {}
     if avoid_subspaces is None:
         avoid_subspaces = []
+    if excluded_transitions is None:
+        excluded_transitions = set()
     dom_mod = "--dom-mod=3, 16"  # for fixed points
 
     # "0" specifies that all solutions should be listed (we implement the limit
@@ -347,34 +373,46 @@ def _create_clingo_fixed_point_constraints(
     # TODO: Explain what remaining options mean and why we need them?
     ctl = Control(["0", "--heuristic=Domain", "--enum-mod=domRec", dom_mod])
 
+    # All rules are collected first and then parsed by clingo at once.
+    program: list[str] = []
+
     # Declare places and their conflicts based on network variables.
     for node in variables:
         p_name = variable_to_place(node, positive=True)
         n_name = variable_to_place(node, positive=False)
 
         # Declare a positive and negative symbol.
-        ctl.add("base", [], f"{{{p_name}}}.")
-        ctl.add("base", [], f"{{{n_name}}}.")
+        program.append(f"{{{p_name}}}.")
+        program.append(f"{{{n_name}}}.")
 
         # Assert there is a fixed point.
-        ctl.add("base", [], f":- {p_name}, {n_name}.")
-        ctl.add("base", [], f"{p_name} ; {n_name}.")
+        program.append(f":- {p_name}, {n_name}.")
+        program.append(f"{p_name} ; {n_name}.")
 
     for node, kind in petri_net.nodes(data="kind"):  # type: ignore
-        if kind == "place":
+        if kind == "place" or node in excluded_transitions:
             continue
         elif kind == "transition":
             preds = list(petri_net.predecessors(node))  # type: ignore
 
             pred_rhs = "; ".join(preds)  # type: ignore
-            ctl.add("base", [], f":- {pred_rhs}.")
+            if retain_externals:
+                # The consumed place is an input of the transition that is not
+                # also its output.
+                succs = set(petri_net.successors(node))  # type: ignore
+                for place in preds:  # type: ignore
+                    if place not in succs:
+                        retain_atom = f"{_RETAIN_PREFIX}{place}"
+                        program.append(f"#external {retain_atom}.")
+                        pred_rhs += f"; not {retain_atom}"
+            program.append(f":- {pred_rhs}.")
         else:
             raise Exception(f"Unexpected node kind: `{kind}`.")
 
     # Ensure that solutions must have desired variables fixed based on `ensure_subspace`.
     for fixed_var, value in ensure_subspace.items():
         place_name = variable_to_place(fixed_var, positive=bool(value))
-        ctl.add("base", [], f"{place_name}.")
+        program.append(f"{place_name}.")
 
     # Ensure that fixed points can't lie in either subspace in `avoid_subspaces`.
     for to_avoid in avoid_subspaces:
@@ -387,11 +425,12 @@ def _create_clingo_fixed_point_constraints(
                 variable_to_place(var, (to_avoid[var] == 1)) for var in to_avoid
             ]
             fixed_vars = ", ".join(fixed_list)
-            ctl.add("base", [], f":- {fixed_vars}.")
+            program.append(f":- {fixed_vars}.")
         else:
-            ctl.add("base", [], "#false.")
+            program.append("#false.")
             break  # There is no solution and we do not need to process more.
 
+    ctl.add("base", [], "\n".join(program))
     return ctl
 
 
@@ -421,27 +460,25 @@ def compute_fixed_point_reduced_STG_async(
     if avoid_subspaces is None:
         avoid_subspaces = []
 
-    # Build a copy of the original Petri net where the
-    # variables in the retained set can only change their
-    # value towards the "retain value".
-    reduced_petri_net: DiGraph = petri_net.copy()  # type: ignore
+    # Find the transitions that must be removed from the original Petri net
+    # such that the variables in the retained set can only change their
+    # value towards the "retain value". The Petri net itself is not copied.
+    deleted_transitions: set[str] = set()
     for node in retained_set.keys():
         b_i = retained_set[node]
         source_place = variable_to_place(node, positive=(b_i == 1))
 
-        preds = list(reduced_petri_net.predecessors(source_place))  # type: ignore # noqa
-        succs = list(reduced_petri_net.successors(source_place))  # type: ignore # noqa
-
-        deleted_transitions = list(set(succs) - set(preds))  # type: ignore # noqa
+        preds = set(petri_net.predecessors(source_place))  # type: ignore # noqa
+        succs = set(petri_net.successors(source_place))  # type: ignore # noqa
 
-        for trans in deleted_transitions:  # type: ignore # noqa
-            reduced_petri_net.remove_node(trans)  # type: ignore # noqa
+        deleted_transitions |= succs - preds  # type: ignore # noqa
 
     ctl = _create_clingo_fixed_point_constraints(
-        extract_variable_names(reduced_petri_net),
-        reduced_petri_net,
+        extract_variable_names(petri_net),
+        petri_net,
         ensure_subspace,
         avoid_subspaces,
+        excluded_transitions=deleted_transitions,
     )
 
     ctl.ground([("base", [])])
@@ -454,6 +491,82 @@ def compute_fixed_point_reduced_STG_async(
     # Else: unsat, hence we don't do anything.
 
 
+def fixed_point_reduced_STG_solver(
+    petri_net: DiGraph,
+    ensure_subspace: BooleanSpace | None = None,
+    avoid_subspaces: list[BooleanSpace] | None = None,
+) -> Callable[[BooleanSpace, int | None], list[BooleanSpace]]:
+    """
+    Prepare :func:`compute_fixed_point_reduced_STG` for repeated use with
+    different retained sets.
+
+    The ASP program for the `petri_net` is grounded only once. Instead of
+    removing the transitions from the Petri net, the retained set is applied
+    by switching clingo external atoms before each solver call. This is
+    useful when many retained sets are tested for the same network, e.g.
+    during retained set optimization.
+
+    Parameters
+    ----------
+    petri_net : DiGraph
+        The Petri net which was created by the implicant encoding from a
+        Boolean network. See :mod:`petri_net_translation<biobalm.petri_net_translation>`
+        for details.
+    ensure_subspace : BooleanSpace | None
+        Only fixed points in this subspace will be considered or returned.
+    avoid_subspaces : list[BooleanSpace] | None
+        Only fixed points not in any of these subspaces will be considered or
+        returned.
+
+    Returns
+    -------
+    Callable[[BooleanSpace, int | None], list[BooleanSpace]]
+        A function that takes a retained set and a solution limit, and returns
+        the same list of fixed points as :func:`compute_fixed_point_reduced_STG`.
+    """
+    ctl = _create_clingo_fixed_point_constraints(
+        extract_variable_names(petri_net),
+        petri_net,
+        ensure_subspace,
+        avoid_subspaces,
+        retain_externals=True,
+    )
+    ctl.ground([("base", [])])
+
+    # The retained set that is currently enabled through the external atoms.
+    enabled: BooleanSpace = {}
+
+    def set_retained(var: str, value: Literal[0, 1], is_retained: bool):
+        place = variable_to_place(var, positive=(value == 1))
+        # Places that are not consumed by any transition have no external
+        # atom, in which case this has no effect.
+        ctl.assign_external(Function(f"{_RETAIN_PREFIX}{place}"), is_retained)
+
+    def solve(
+        retained_set: BooleanSpace, solution_limit: int | None = None
+    ) -> list[BooleanSpace]:
+        for var, value in enabled.items():
+            if retained_set.get(var) != value:
+                set_retained(var, value, False)
+        for var, value in retained_set.items():
+            if enabled.get(var) != value:
+                set_retained(var, value, True)
+        enabled.clear()
+        enabled.update(retained_set)
+
+        results: list[BooleanSpace] = []
+        result = ctl.solve(yield_=True)
+        if isinstance(result, SolveHandle):
+            with result as iterator:
+                for model in iterator:
+                    results.append(_clingo_model_to_fixed_point(model))
+                    if solution_limit is not None and len(results) >= solution_limit:
+                        break
+        return results
+
+    return solve
+
+
 def compute_fixed_point_reduced_STG(
     petri_net: DiGraph,
     retained_set: BooleanSpace = {},
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Literal, TypeAlias, TypedDict
+from typing import Literal, NotRequired, TypeAlias, TypedDict
 
 import networkx as nx  # type: ignore
 import biodivine_aeon as ba
@@ -50,6 +50,20 @@ class SuccessionDiagramState(TypedDict):
     "Global" configuration of a succession diagram.
     """
 
+    clean: NotRequired[bool]
+    """
+    `True` if the `network_rules` were produced from an already cleaned-up
+    network (see :func:`biobalm.interaction_graph_utils.cleanup_network`).
+    Missing in states created by older versions.
+    """
+
+    motif_nodes: NotRequired[dict[int, int]]
+    """
+    A dictionary mapping the keys of already percolated stable motifs to
+    the positions of their nodes (see :func:`biobalm.space_utils.space_unique_key`).
+    Missing in states created by older versions.
+    """
+
 
 class NodeData(TypedDict):
     """
@@ -103,6 +117,14 @@ class NodeData(TypedDict):
     often used instead).
     """
 
+    percolated_fvs: list[str] | None
+    """
+    An (unsigned) FVS of the `percolated_network`. This is cheaper to compute
+    than `percolated_nfvs`, and every FVS is also a valid NFVS.
+
+    If `None`, this has not been computed yet.
+    """
+
     percolated_nfvs: list[str] | None
     """
     An NFVS of the `percolated_network`.
@@ -242,3 +264,16 @@ class SuccessionDiagramConfiguration(TypedDict):
     in the recent round. That is, if simulation has actively eliminated some candidates in
     the recent round, it will still continue regardless of the budget limit.
     """
+
+    parallel_workers: int
+    """
+    The number of worker processes used to compute the attractors of multiple
+    nodes at the same time. Process pools are started by
+    :meth:`SuccessionDiagram.build` (attractor seeds of all expanded nodes),
+    :meth:`SuccessionDiagram.expanded_attractor_seeds`, and
+    :meth:`SuccessionDiagram.expanded_attractor_sets`, for nodes where the
+    respective results are not known yet. With `1`, everything is computed in
+    the current process.
+
+    [Default: 1]
+    """
@@ -1,15 +1,21 @@
+import pytest
 from biodivine_aeon import AsynchronousGraph, BooleanExpression, BooleanNetwork
 
+import biobalm.space_utils as space_utils
 from biobalm.space_utils import (
     expression_to_space_list,
     is_subspace,
+    iter_expression_spaces,
     percolate_network,
     percolate_space,
     percolate_space_strict,
+    percolate_spaces_strict,
     percolation_conflicts,
+    remove_state_from_dnf,
     restrict_expression,
     space_unique_key,
 )
+from biobalm.types import BooleanSpace
 
 
 def test_is_subspace():
@@ -19,6 +25,19 @@ def test_is_subspace():
     assert not is_subspace({"x": 1, "y": 0}, {"x": 0, "y": 0})
 
 
+def test_remove_state_from_dnf():
+    dnf: list[BooleanSpace] = [{"a": 1}, {"a": 0, "b": 1}, {"b": 0}, {"a": 1, "b": 1}]
+    state: BooleanSpace = {"a": 1, "b": 1}
+    expected = [{"a": 0, "b": 1}, {"b": 0}]
+
+    assert remove_state_from_dnf(dnf, state) == expected
+    assert len(dnf) == 4
+
+    result = remove_state_from_dnf(dnf, state, inplace=True)
+    assert result is dnf
+    assert dnf == expected
+
+
 def test_expression_percolation():
     e = BooleanExpression("(a & !x) | (a & y)")
 
@@ -72,6 +91,28 @@ def test_space_percolation():
     assert {"b": 1, "c": 1} == percolate_space_strict(graph, {"a": 1})
 
 
+def test_small_network_percolation(monkeypatch: pytest.MonkeyPatch):
+    bn = BooleanNetwork.from_bnet(
+        """
+    a, !b
+    b, a
+    c, a & c & d | b & !c | c & !d
+    d, !a | d
+    """
+    )
+    graph = AsynchronousGraph(bn)
+    spaces: list[BooleanSpace] = [{}, {"a": 1}, {"a": 0, "d": 1}, {"b": 1, "c": 0}]
+
+    # Multiple spaces in a small network are percolated using bitmasks.
+    fast = percolate_spaces_strict(graph, spaces)
+    assert fast == [percolate_space_strict(graph, space) for space in spaces]
+    assert {"b": 1, "c": 1} == fast[1]
+
+    # Without the bitmask evaluation, the same results are computed using BDDs.
+    monkeypatch.setattr(space_utils, "_SMALL_NETWORK_LIMIT", 0)
+    assert fast == percolate_spaces_strict(graph, spaces)
+
+
 def test_constant_percolation():
     bn = BooleanNetwork.from_bnet(
         """
@@ -132,6 +173,8 @@ def test_expression_to_spaces():
 
     assert {"a": 1, "c": 0} not in spaces
 
+    assert spaces == list(iter_expression_spaces(e))
+
 
 def test_space_unique_key():
     bn = BooleanNetwork.from_bnet(
@@ -144,6 +187,12 @@ def test_space_unique_key():
     assert space_unique_key({"a": 1}, bn) == space_unique_key({"a": 1}, bn)
     assert space_unique_key({"a": 1}, bn) != space_unique_key({"b": 1}, bn)
 
+    indices = {"a": 0, "b": 1, "c": 2}
+    for space in [{}, {"a": 1}, {"b": 0, "c": 1}]:
+        assert space_unique_key(space, bn) == space_unique_key(space, indices)
+    with pytest.raises(IndexError):
+        space_unique_key({"x": 1}, indices)
+
 
 def test_perc_and_remove_constants_from_bn():
     bn = BooleanNetwork.from_bnet(
@@ -1,9 +1,13 @@
+import pickle
 import unittest
 
+import pytest
 from biodivine_aeon import AsynchronousGraph, Attractors, BooleanNetwork
 
 import biobalm
 import biobalm.succession_diagram
+from biobalm.petri_net_translation import restrict_petrinet_to_subspace
+from biobalm.space_utils import percolate_space
 from biobalm.succession_diagram import SuccessionDiagram
 from biobalm.types import BooleanSpace
 
@@ -116,6 +120,72 @@ def test_state():
     assert sd1.summary() == sd2.summary()
 
 
+def test_state_without_clean_marker():
+    sd = SuccessionDiagram.from_rules("a, a\nb, !a")
+    state = sd.__getstate__()
+    assert state["clean"]
+
+    # Older (or hand-built) states may contain networks that were not cleaned
+    # up, e.g. with regulations that do not match the update functions.
+    del state["clean"]
+    state["network_rules"] = "a -> b\na -> a\n$a: a\n$b: !a\n"
+    sd_old = SuccessionDiagram.__new__(SuccessionDiagram)
+    sd_old.__setstate__(state)
+    assert sd_old.network.variable_count() == 2
+
+
+def test_expand_while_iterating():
+    sd = SuccessionDiagram.from_rules("A, B\nB, A\nC, C & B")
+
+    # Only nodes that exist at the start are visited, but the iteration
+    # itself must survive the newly created nodes.
+    visited = []
+    for node_id in sd.stub_ids():
+        sd.node_successors(node_id, compute=True)
+        visited.append(node_id)
+    assert visited == [sd.root()]
+    assert len(sd) > 1
+
+    sd.build()
+    assert list(sd.expanded_ids()) == list(sd.node_ids())
+    assert list(sd.stub_ids()) == []
+    assert list(sd.reversed_expanded_ids()) == list(reversed(range(len(sd))))
+
+
+def test_percolated_network_from_parent():
+    sd = SuccessionDiagram.from_file("models/bbm-bnet-inputs-true/033.bnet")
+    sd.expand_bfs()
+
+    # Networks of child nodes are derived from the already percolated
+    # networks of their parents. This must not change the result.
+    for node_id in sd.node_ids():
+        network = sd.node_percolated_network(node_id, compute=True)
+        expected = biobalm.succession_diagram.percolate_network(
+            sd.network, sd.node_data(node_id)["space"], remove_constants=True
+        )
+        assert network.to_bnet() == expected.to_bnet()
+
+
+def test_reclaim_node_data():
+    sd = SuccessionDiagram.from_file("models/bbm-bnet-inputs-true/033.bnet")
+    sd.build()
+    seeds = sd.expanded_attractor_seeds()
+
+    sd.reclaim_node_data()
+    for node_id in sd.node_ids():
+        data = sd.node_data(node_id)
+        assert data["percolated_network"] is None
+        assert data["percolated_petri_net"] is None
+        assert data["percolated_fvs"] is None
+        assert data["percolated_nfvs"] is None
+        if data["attractor_seeds"] is not None:
+            assert data["attractor_candidates"] is None
+
+    # Reclaimed data is recomputed when needed.
+    assert sd.expanded_attractor_seeds() == seeds
+    assert len(sd.node_percolated_nfvs(sd.root(), compute=True)) > 0
+
+
 def test_expansion_depth_limit_bfs():
     bn = BooleanNetwork.from_file("models/bbm-bnet-inputs-true/033.bnet")
 
@@ -317,3 +387,226 @@ def test_attractor_extraction():
     sd.build()
     eas = sd.expanded_attractor_seeds()
     assert eas == {1: [{"A": 0, "B": 0, "C": 1}], 2: [{"A": 1, "B": 1, "C": 1}]}
+
+
+def test_parallel_attractor_sets():
+    sd = SuccessionDiagram.from_file("models/bbm-bnet-inputs-true/033.bnet")
+    sd.build()
+    expected = sd.expanded_attractor_sets()
+
+    config = SuccessionDiagram.default_config()
+    config["parallel_workers"] = 2
+    sd_parallel = SuccessionDiagram.from_file(
+        "models/bbm-bnet-inputs-true/033.bnet", config
+    )
+    sd_parallel.build()
+
+    # Seeds are computed in parallel by `build`.
+    assert len(sd_parallel) == len(sd)
+    for node_id in sd.node_ids():
+        assert (
+            sd_parallel.node_data(node_id)["attractor_seeds"]
+            == sd.node_data(node_id)["attractor_seeds"]
+        )
+
+    result = sd_parallel.expanded_attractor_sets()
+
+    assert result.keys() == expected.keys()
+    for node_id, sets in result.items():
+        assert len(sets) == len(expected[node_id])
+        for x, y in zip(sets, expected[node_id]):
+            assert x.is_subset(y) and y.is_subset(x)
+        assert sd_parallel.node_attractor_seeds(node_id) == sd.node_attractor_seeds(
+            node_id
+        )
+
+
+def test_known_motifs_are_not_percolated(monkeypatch: pytest.MonkeyPatch):
+    sd = SuccessionDiagram.from_file("models/bbm-bnet-inputs-true/033.bnet")
+    sd.expand_bfs()
+
+    def fail(*_):
+        raise AssertionError("Known motif percolated again.")
+
+    monkeypatch.setattr(biobalm.succession_diagram, "percolate_space", fail)
+    for parent_id, child_id in sd.dag.edges():
+        motif = sd.edge_stable_motif(parent_id, child_id)
+        assert sd._ensure_node(parent_id, motif) == child_id  # type: ignore
+
+
+def test_motif_nodes_after_unpickling():
+    sd = SuccessionDiagram.from_file("models/bbm-bnet-inputs-true/033.bnet")
+    sd.expand_scc()
+
+    sd_copy = pickle.loads(pickle.dumps(sd))
+    assert sd_copy._motif_nodes == sd._motif_nodes  # type: ignore
+
+    # Older states do not store the motifs. Edges created by the SCC expansion
+    # can have motifs that do not percolate to their child, so these must be
+    # percolated again.
+    state = pickle.loads(pickle.dumps(sd.__getstate__()))
+    del state["motif_nodes"]
+    sd_old = SuccessionDiagram.__new__(SuccessionDiagram)
+    sd_old.__setstate__(state)
+    for parent_id, child_id in sd.dag.edges():
+        motif = sd.edge_stable_motif(parent_id, child_id)
+        node_id = sd_old._ensure_node(None, motif)  # type: ignore
+        assert sd_old.node_data(node_id)["space"] == percolate_space(
+            sd_old.symbolic, motif
+        )
+
+
+def test_parallel_expanded_attractor_seeds():
+    sd = SuccessionDiagram.from_file("models/bbm-bnet-inputs-true/033.bnet")
+    sd.expand_bfs()
+    expected = sd.expanded_attractor_seeds()
+
+    config = SuccessionDiagram.default_config()
+    config["parallel_workers"] = 2
+    sd_parallel = SuccessionDiagram.from_file(
+        "models/bbm-bnet-inputs-true/033.bnet", config
+    )
+    sd_parallel.expand_bfs()
+
+    # Unlike `build`, the expansion does not compute any seeds.
+    assert all(
+        sd_parallel.node_data(i)["attractor_seeds"] is None
+        for i in sd_parallel.expanded_ids()
+    )
+    assert sd_parallel.expanded_attractor_seeds() == expected
+
+
+def test_config_without_parallel_workers():
+    sd = SuccessionDiagram.from_file("models/bbm-bnet-inputs-true/033.bnet")
+    state = sd.__getstate__()
+    del state["config"]["parallel_workers"]  # type: ignore
+
+    # A diagram pickled before the option existed still works.
+    sd_old = SuccessionDiagram.__new__(SuccessionDiagram)
+    sd_old.__setstate__(state)
+    sd_old.build()
+    assert len(sd_old.expanded_attractor_seeds()) > 0
+    assert len(sd_old.expanded_attractor_sets()) > 0
+
+
+def test_node_data_without_percolated_fvs():
+    sd = SuccessionDiagram.from_file("models/bbm-bnet-inputs-true/033.bnet")
+    sd.expand_bfs()
+    state = sd.__getstate__()
+    for _, data in state["dag"].nodes(data=True):
+        del data["percolated_fvs"]
+
+    # A diagram pickled before the field existed still works.
+    sd_old = SuccessionDiagram.__new__(SuccessionDiagram)
+    sd_old.__setstate__(state)
+    for node_id in sd_old.node_ids():
+        assert sd_old.node_data(node_id)["percolated_fvs"] is None
+        assert sd_old.node_percolated_nfvs(node_id, compute=True) is not None
+
+
+def test_node_percolated_fvs_variants():
+    sd = SuccessionDiagram.from_file("models/bbm-bnet-inputs-true/033.bnet")
+    root = sd.root()
+
+    with pytest.raises(KeyError):
+        sd.node_percolated_nfvs(root)
+
+    # The unsigned FVS does not trigger the signed computation.
+    fvs = sd.node_percolated_nfvs(root, compute=True, parity=None)
+    assert sd.node_data(root)["percolated_fvs"] == fvs
+    assert sd.node_data(root)["percolated_nfvs"] is None
+
+    # The negative variant is the default.
+    nfvs = sd.node_percolated_nfvs(root, compute=True)
+    assert sd.node_data(root)["percolated_nfvs"] == nfvs
+    assert len(nfvs) <= len(fvs)
+    assert sd.node_percolated_nfvs(root) == nfvs
+    assert sd.node_percolated_nfvs(root, parity=None) == fvs
+
+
+def test_expand_minimal_spaces_repeated():
+    sd = SuccessionDiagram.from_file("models/bbm-bnet-inputs-true/033.bnet")
+
+    # A failed expansion can be resumed without recomputing the minimal traps.
+    assert not sd.expand_minimal_spaces(size_limit=2)
+    traps = sd._minimal_traps  # type: ignore
+    assert traps is not None
+    assert sd.expand_minimal_spaces()
+    assert sd._minimal_traps is traps  # type: ignore
+
+    spaces = [sd.node_data(i)["space"] for i in sd.minimal_trap_spaces()]
+    assert sorted(sorted(s.items()) for s in spaces) == sorted(
+        sorted(t.items()) for t in traps
+    )
+
+
+def test_build_releases_percolated_caches():
+    sd = SuccessionDiagram.from_file("models/bbm-bnet-inputs-true/033.bnet")
+    sd.build()
+
+    for node_id in sd.node_ids():
+        data = sd.node_data(node_id)
+        if data["attractor_sets"] is not None:
+            assert data["percolated_network"] is None
+            assert data["percolated_petri_net"] is None
+
+    # Released caches are recomputed on demand.
+    sd.release_percolated_caches(sd.root())
+    assert sd.node_data(sd.root())["percolated_network"] is None
+    assert sd.node_percolated_network(sd.root(), compute=True) is not None
+    assert len(sd.expanded_attractor_sets()) > 0
+
+
+def test_edge_motif_shares_child_space():
+    sd = SuccessionDiagram.from_file("models/bbm-bnet-inputs-true/033.bnet")
+    sd.expand_bfs()
+
+    for parent_id, child_id in sd.dag.edges():
+        motif = sd.edge_stable_motif(parent_id, child_id)
+        child_space = sd.node_data(child_id)["space"]
+        if motif == child_space:
+            assert motif is child_space
+
+
+def test_expand_fixed_point_keeps_attractors():
+    sd = SuccessionDiagram.from_rules("a, !b\nb, !a")
+    sd.expand_bfs(bfs_level_limit=0)
+
+    child = sd.node_successors(sd.root())[0]
+    seeds = sd.node_attractor_seeds(child, compute=True)
+    assert not sd.node_data(child)["expanded"]
+
+    # Expanding a fixed-point node does not invalidate its attractors.
+    sd.expand_bfs()
+    assert sd.node_data(child)["expanded"]
+    assert sd.node_data(child)["attractor_seeds"] == seeds
+
+
+def test_attractor_sets_without_seeds():
+    sd = SuccessionDiagram.from_rules("a, !b\nb, !a")
+    sd.build()
+
+    # The root has no attractors of its own, so its sets are known
+    # from the seeds alone.
+    root = sd.root()
+    assert sd.node_attractor_seeds(root) == []
+    sd.node_data(root)["attractor_sets"] = None
+    assert sd.node_attractor_sets(root) == []
+
+
+def test_percolated_petri_net_from_ancestor():
+    sd = SuccessionDiagram.from_file("models/bbm-bnet-inputs-true/033.bnet")
+    sd.expand_bfs()
+    expected = {
+        i: restrict_petrinet_to_subspace(sd.petri_net, sd.node_data(i)["space"])
+        for i in sd.node_ids()
+    }
+
+    # Only the root keeps its Petri net, every other node is derived from it.
+    sd.reclaim_node_data()
+    sd.node_percolated_petri_net(sd.root(), compute=True)
+
+    for node_id in sorted(sd.node_ids(), key=lambda i: -sd.node_data(i)["depth"]):
+        pn = sd.node_percolated_petri_net(node_id, compute=True)
+        assert set(pn.edges()) == set(expected[node_id].edges())
+        assert dict(pn.nodes(data="kind")) == dict(expected[node_id].nodes(data="kind"))
@@ -2,7 +2,11 @@ from biodivine_aeon import AsynchronousGraph, BooleanNetwork, FixedPoints
 
 from biobalm.interaction_graph_utils import cleanup_network
 from biobalm.petri_net_translation import network_to_petrinet
-from biobalm.trappist_core import compute_fixed_point_reduced_STG, trappist
+from biobalm.trappist_core import (
+    compute_fixed_point_reduced_STG,
+    fixed_point_reduced_STG_solver,
+    trappist,
+)
 from biobalm.types import BooleanSpace
 
 
@@ -124,3 +128,39 @@ def test_network_fixed_point_reduced_STG():
         avoid_subspaces=[avoid_subspace_3],
     )
     assert len(candidate_set) == 1  # candidate_set = {10}
+
+
+def test_fixed_point_reduced_STG_solver():
+    # The reusable solver must give the same results as
+    # `compute_fixed_point_reduced_STG` for a sequence of retained sets.
+
+    bn = BooleanNetwork.from_bnet(
+        """
+        x1, (x1 & x2) | (!x1 & !x2)
+        x2, (x1 & x2) | (!x1 & !x2)
+        x3, !x3 | x1
+    """
+    )
+
+    petri_net = network_to_petrinet(bn)
+    avoid: list[BooleanSpace] = [{"x1": 1, "x2": 1}]
+
+    solver = fixed_point_reduced_STG_solver(petri_net, avoid_subspaces=avoid)
+
+    retained_sets: list[BooleanSpace] = [
+        {},
+        {"x1": 0, "x2": 0},
+        {"x1": 1, "x2": 1, "x3": 1},
+        {"x1": 0, "x3": 0},
+        {},
+    ]
+    for retained_set in retained_sets:
+        expected = compute_fixed_point_reduced_STG(
+            petri_net, retained_set, avoid_subspaces=avoid
+        )
+        result = solver(retained_set, None)
+        assert sorted(sorted(x.items()) for x in result) == sorted(
+            sorted(x.items()) for x in expected
+        )
+
+    assert len(solver({"x1": 1, "x2": 1, "x3": 1}, 1)) == 1